@@ -0,0 +1,283 @@
+"""Times how long manim_ace takes to build things, without rendering frames.
+
+Run from the root of the repo:
+
+    python -m benchmarks.run                      # everything but the slow ones
+    python -m benchmarks.run -k list --json out.json
+    python -m benchmarks.run --group slow          # connect_four end-to-end
+    python -m benchmarks.run --compare out.json    # compare against a saved run
+
+Scenes run with skip_animations and manim's dry_run, so animations are built
+and finished but no frames are drawn and no files are written.
+"""
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass
+
+from manim import *
+from manim import __version__ as manim_version
+
+from manim_ace.code import CodeWindow, ScrollingCodeWindow
+from manim_ace.functions import Function
+from manim_ace.lists import List
+from manim_ace.loops import ForRange
+from manim_ace.scene import AnimatedCodeScene
+from manim_ace.text_cache import text_cache
+from manim_ace.variables import VariableArea
+
+
+@dataclass
+class Benchmark:
+    name: str
+    fn: callable
+    params: tuple
+    group: str
+
+
+BENCHMARKS = []
+
+
+def benchmark(*params, group='fast'):
+    """Registers fn(param), which does any setup and returns the callable to
+    time. Without params, fn is called with None."""
+    def register(fn):
+        BENCHMARKS.append(Benchmark(fn.__name__, fn, params or (None,), group))
+        return fn
+    return register
+
+
+def run_scene(construct, scene_class=AnimatedCodeScene):
+    """Runs construct(scene) as the body of an AnimatedCodeScene."""
+    class BenchmarkScene(scene_class):
+        def construct(self):
+            super().construct()
+            construct(self)
+
+    with tempconfig({'dry_run': True, 'disable_caching': True,
+                     'verbosity': 'ERROR', 'quality': 'low_quality'}):
+        BenchmarkScene(skip_animations=True).render()
+
+
+def make_source(num_lines: int) -> str:
+    lines = ['def work(data):']
+    for i in range(1, num_lines):
+        indent = '    ' * (1 + i % 3)
+        lines.append(f'{indent}total_{i} = data[{i}] + len("row {i}")')
+    return '\n'.join(lines) + '\n'
+
+
+@benchmark(10, 50, 200)
+def code_window(num_lines):
+    source = make_source(num_lines)
+
+    def run():
+        CodeWindow.use_disk_cache = False
+        try:
+            CodeWindow(source)
+        finally:
+            CodeWindow.use_disk_cache = True
+    return run
+
+
+@benchmark(10, 50, 200)
+def code_window_disk_cached(num_lines):
+    source = make_source(num_lines)
+    CodeWindow(source)
+    return lambda: CodeWindow(source)
+
+
+@benchmark(50, 300)
+def scrolling_code_window(num_lines):
+    source = make_source(num_lines)
+
+    def run():
+        ScrollingCodeWindow.use_disk_cache = False
+        try:
+            ScrollingCodeWindow(source)
+        finally:
+            ScrollingCodeWindow.use_disk_cache = True
+    return run
+
+
+@benchmark(1, 10, 100)
+def variable_area(num_variables):
+    def run():
+        area = VariableArea()
+        scope = area.top_scope()
+        for i in range(0, num_variables):
+            scope.create_variable(f'var_{i}', i)
+    return run
+
+
+@benchmark(10, 100, 500)
+def list_construct(num_items):
+    return lambda: List(list(range(0, num_items)))
+
+
+@benchmark(10, 100, 500)
+def list_append(num_items):
+    def construct(scene):
+        lst = List()
+        scene.add(lst)
+        for i in range(0, num_items):
+            resize_anims, copy_anims = lst.animate_append(i)
+            scene.play(*resize_anims, *copy_anims)
+    return lambda: run_scene(construct)
+
+
+@benchmark(10, 100, 500)
+def list_set(num_items):
+    def construct(scene):
+        lst = List(list(range(0, num_items)))
+        scene.add(lst)
+        for i in range(0, num_items):
+            resize_anims, copy_anims = lst.animate_set(i, i + 1)
+            scene.play(*resize_anims, *copy_anims)
+    return lambda: run_scene(construct)
+
+
+@benchmark(10, 100, 500)
+def list_set_many(num_items):
+    def construct(scene):
+        lst = List(list(range(0, num_items)))
+        scene.add(lst)
+        resize_anims, copy_anims = lst.animate_set_many(
+            {i: i + 1 for i in range(0, num_items)})
+        scene.play(*resize_anims, *copy_anims)
+    return lambda: run_scene(construct)
+
+
+@benchmark(5, 20, 100)
+def for_range(num_iterations):
+    source = f'for i in range(0, {num_iterations}):\n    print(i)\n'
+
+    def construct(scene):
+        code = CodeWindow(source)
+        scene.set_code(code)
+        variables = VariableArea()
+        scene.set_variables(variables)
+        scene.add(variables)
+        scene.play(scene.move_pc(1, 0, 3))
+        loop_var = scene.create_variable('i', 0, show_value=False)
+        loop = ForRange(loop_var, code['line_1'][9:])
+        loop.show_range(scene, 0, num_iterations)
+        for _ in range(0, num_iterations):
+            loop.go_next(scene)
+        loop.finish(scene)
+    return lambda: run_scene(construct)
+
+
+@benchmark(1, 5, 20)
+def function_boxes(num_functions):
+    def run():
+        for i in range(0, num_functions):
+            Function(f'fn_{i}()', f'does thing\nnumber {i}', num_inputs=1 + i % 3)
+    return run
+
+
+@benchmark('BoardScene', 'AddTokenScene', 'HorizontalWinnerScene',
+           'OtherDirectionScene', 'ConnectFourIntro', 'ConnectFourOutro',
+           group='slow')
+def connect_four(scene_name):
+    module = importlib.import_module('connect_four')
+    scene_class = getattr(module, scene_name)
+
+    def run():
+        with tempconfig({'dry_run': True, 'disable_caching': True,
+                         'verbosity': 'ERROR', 'quality': 'low_quality'}):
+            scene_class(skip_animations=True).render()
+    return run
+
+
+def time_benchmark(bench: Benchmark, param, repeat: int, warm: bool) -> dict:
+    run = bench.fn(param)
+    times = []
+    for _ in range(0, repeat):
+        if not warm:
+            text_cache.clear()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {
+        'name': bench.name,
+        'param': param,
+        'group': bench.group,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='keyword', default='',
+                        help='only run benchmarks whose name contains this')
+    parser.add_argument('--group', default='fast', choices=['fast', 'slow', 'all'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--warm', action='store_true',
+                        help='keep the text cache between repeats')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='a --json file from an earlier run')
+    args = parser.parse_args(argv)
+
+    # Keep the disk caches from polluting (or helping) the real ones
+    temp_cache = None
+    if not os.environ.get('MANIM_ACE_CACHE_DIR'):
+        temp_cache = tempfile.TemporaryDirectory(prefix='manim_ace_bench_')
+        os.environ['MANIM_ACE_CACHE_DIR'] = temp_cache.name
+    try:
+        run_benchmarks(args)
+    finally:
+        if temp_cache is not None:
+            del os.environ['MANIM_ACE_CACHE_DIR']
+            temp_cache.cleanup()
+
+
+def run_benchmarks(args):
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            for result in json.load(f)['results']:
+                baseline[(result['name'], str(result['param']))] = result
+
+    results = []
+    for bench in BENCHMARKS:
+        if args.group != 'all' and bench.group != args.group:
+            continue
+        if args.keyword not in bench.name:
+            continue
+        for param in bench.params:
+            result = time_benchmark(bench, param, args.repeat, args.warm)
+            results.append(result)
+            line = f"{bench.name}[{param}]".ljust(40) + f"{result['min'] * 1000:10.1f} ms"
+            old = baseline.get((bench.name, str(param)))
+            if old:
+                line += f"   {result['min'] / old['min']:.2f}x of baseline"
+            print(line, flush=True)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'manim_version': manim_version,
+                'python': sys.version,
+                'machine': platform.platform(),
+                'time': time.time(),
+                'repeat': args.repeat,
+                'warm': args.warm,
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
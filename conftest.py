@@ -0,0 +1,2 @@
+# Here so pytest puts the repository on sys.path and the tests can import
+# manim_ace without it being installed.
@@ -605,16 +605,19 @@ class AddTokenScene(AnimatedCodeScene):
     # a player has won, starting with identifying four tokens in a row horizontally.""
     anims = [FadeOut(self.pc), FadeOut(o_mid), FadeOut(o_top)]
     for r in range(0, len(partial_game)):
+      new_values = {}
       for c in range(0, len(partial_game[0])):
         token = partial_game[r][c]
         if token == ' ' or '*' in token:
           continue
-        _, copy_anims = self.rows[r].animate_set(c, token)
+        new_values[c] = token
         color = PLAYER_ONE_COLOR if token == PLAYER_ONE_TOKEN else PLAYER_TWO_COLOR
         back = self.rows[r].add_background_for_cell(c, color)
         back.set_opacity(0)
-        anims += copy_anims
         anims.append(back.animate.set_opacity(1.0))
+      if new_values:
+        resize_anims, copy_anims = self.rows[r].animate_set_many(new_values)
+        anims += resize_anims + copy_anims
 
     new_code = CodeWindow(third_scene_code, tab_width=2, start_at_line=21)
     new_code.scale(0.8).align_to(code.get_corner(DL) + [0.0, -0.105, 0], UL)
@@ -1136,16 +1139,19 @@ class HorizontalWinnerScene(AnimatedCodeScene):
     backgrounds = {}
     anims = []
     for r in range(0, len(partial_game)):
+      new_values = {}
       for c in range(0, len(partial_game[0])):
         token = partial_game[r][c]
         token = token.replace('*', '')
         if token == ' ':
           continue
-        _, copy_anims = rows[r].animate_set(c, token)
+        new_values[c] = token
         color = PLAYER_ONE_COLOR if token == PLAYER_ONE_TOKEN else PLAYER_TWO_COLOR
         back = rows[r].add_background_for_cell(c, color)
         backgrounds[(r, c)] = back
-        anims += copy_anims
+      if new_values:
+        resize_anims, copy_anims = rows[r].animate_set_many(new_values)
+        anims += resize_anims + copy_anims
     self.play(*anims)
     self.next_section()
     self.pause()
@@ -1817,16 +1823,19 @@ class OtherDirectionScene(AnimatedCodeScene):
     backgrounds = {}
     anims = []
     for r in range(0, len(partial_game)):
+      new_values = {}
       for c in range(0, len(partial_game[0])):
         token = partial_game[r][c]
         token = token.replace('*', '')
         if token == ' ':
           continue
-        _, copy_anims = rows[r].animate_set(c, token)
+        new_values[c] = token
         color = PLAYER_ONE_COLOR if token == PLAYER_ONE_TOKEN else PLAYER_TWO_COLOR
         back = rows[r].add_background_for_cell(c, color)
         backgrounds[(r, c)] = back
-        anims += copy_anims
+      if new_values:
+        resize_anims, copy_anims = rows[r].animate_set_many(new_values)
+        anims += resize_anims + copy_anims
     self.play(*anims)
     self.next_section()
     self.pause()
@@ -2265,16 +2274,19 @@ class ConnectFourOutro(AnimatedCodeScene):
     backgrounds = {}
     anims = []
     for r in range(0, len(partial_game)):
+      new_values = {}
       for c in range(0, len(partial_game[0])):
         token = partial_game[r][c]
         token = token.replace('*', '')
         if token == ' ':
           continue
-        _, copy_anims = rows[r].animate_set(c, token)
+        new_values[c] = token
         color = PLAYER_ONE_COLOR if token == PLAYER_ONE_TOKEN else PLAYER_TWO_COLOR
         back = rows[r].add_background_for_cell(c, color)
         backgrounds[(r, c)] = back
-        anims += copy_anims
+      if new_values:
+        resize_anims, copy_anims = rows[r].animate_set_many(new_values)
+        anims += resize_anims + copy_anims
     self.play(*anims)
     self.next_section()
     self.pause()
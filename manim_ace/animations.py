@@ -0,0 +1,126 @@
+from manim import *
+
+import numpy as np
+
+
+class FadeOpacity(Animation):
+    """Like mobject.animate.set_opacity(opacity), but changes the mobject in
+    place instead of interpolating between two copies of it.
+
+    Only the VMobjects in mobject's family are faded, which is all of them
+    for the Text, Rectangles and lines manim_ace is made of.
+    """
+
+    def __init__(self, mobject: Mobject, opacity: float = 1.0, **kwargs):
+        self.opacity = opacity
+        self.start_alphas = []
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Only the starting opacities are needed, see begin
+        return self.mobject
+
+    def begin(self):
+        self.start_alphas = []
+        for mobj in self.mobject.get_family():
+            if not isinstance(mobj, VMobject):
+                continue
+            self.start_alphas.append((
+                mobj,
+                mobj.fill_rgbas[:, 3].copy(),
+                mobj.stroke_rgbas[:, 3].copy(),
+                mobj.background_stroke_rgbas[:, 3].copy(),
+            ))
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        for mobj, fill, stroke, background in self.start_alphas:
+            mobj.fill_rgbas[:, 3] = fill + (self.opacity - fill) * alpha
+            mobj.stroke_rgbas[:, 3] = stroke + (self.opacity - stroke) * alpha
+            mobj.background_stroke_rgbas[:, 3] = (background
+                                                  + (self.opacity - background) * alpha)
+
+
+def fade_opacity(mobjects: [Mobject], opacity: float = 1.0,
+                 **kwargs) -> [Animation]:
+    """A FadeOpacity for each of mobjects.
+
+    Use this rather than grouping them, because playing an animation of a
+    group that is not in the scene adds it, taking its parts out of
+    wherever (e.g. a VDict) they really are.
+    """
+    return [FadeOpacity(mobj, opacity, **kwargs) for mobj in mobjects]
+
+
+def _rotation(angle: float) -> np.ndarray:
+    """Rotates row vectors by angle around OUT."""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+
+
+class PointerMove(Animation):
+    """Moves a Pointer (from lists.py) to new start and end points.
+
+    Transforming into a new Pointer means building one for every move. This
+    instead works out the line and tip from the interpolated ends on every
+    frame. The tip turns with the line rather than being squashed through
+    its new shape. As the Transform did, the pointer also goes back to
+    black and its own stroke width.
+    """
+
+    def __init__(self, pointer: Mobject, start, end, **kwargs):
+        self.to_start = np.array(start, dtype=float)
+        self.to_end = np.array(end, dtype=float)
+        super().__init__(pointer, **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Everything needed is worked out in begin
+        return self.mobject
+
+    def begin(self):
+        pointer = self.mobject
+        line, tip = pointer['line'], pointer['tip']
+        # Where the pointer really is, which is not always where its start
+        # and end say (e.g. after the list it points into has moved)
+        line_start = line.get_start()
+        self.direction = _unit(tip.tip_point - line_start, RIGHT)
+        self.from_start = line_start - self.direction * pointer.buff
+        self.from_end = tip.tip_point + self.direction * pointer.buff
+        # The tip's shape, pointing right with its point at the origin
+        self.tip_shape = ((tip.points - tip.tip_point)
+                          @ _rotation(-angle_of_vector(tip.tip_point - tip.base)))
+        self.from_stroke = line.stroke_rgbas.copy()
+        self.from_stroke_width = line.stroke_width
+        self.from_fill = tip.fill_rgbas.copy()
+        self.black = color_to_rgba(BLACK)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        alpha = self.rate_func(alpha)
+        start = interpolate(self.from_start, self.to_start, alpha)
+        end = interpolate(self.from_end, self.to_end, alpha)
+        # Keep the last direction if the ends meet
+        self.direction = _unit(end - start, self.direction)
+
+        pointer = self.mobject
+        buff = pointer.buff if np.linalg.norm(end - start) >= 2 * pointer.buff else 0
+        tip_point = end - self.direction * buff
+        pointer['line'].set_points_as_corners([
+            start + self.direction * buff,
+            tip_point - self.direction * pointer.tip_size,
+        ])
+        pointer['tip'].points = (self.tip_shape @ _rotation(angle_of_vector(self.direction))
+                                 + tip_point)
+
+        pointer['line'].stroke_rgbas = interpolate(self.from_stroke, self.black, alpha)
+        pointer['line'].stroke_width = interpolate(self.from_stroke_width,
+                                                   pointer.stroke_width, alpha)
+        pointer['tip'].fill_rgbas = interpolate(self.from_fill, self.black, alpha)
+
+
+def _unit(vector: np.ndarray, default: np.ndarray) -> np.ndarray:
+    length = np.linalg.norm(vector)
+    if length < 1e-8:
+        return default
+    return vector / length
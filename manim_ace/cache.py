@@ -0,0 +1,18 @@
+import os
+
+from pathlib import Path
+
+
+def cache_dir(*parts: str) -> Path:
+    """Where manim_ace keeps things between runs.
+
+    Defaults to ~/.cache/manim_ace (or $XDG_CACHE_HOME/manim_ace) and can be
+    moved with $MANIM_ACE_CACHE_DIR. The directory is created if needed.
+    """
+    root = os.environ.get('MANIM_ACE_CACHE_DIR')
+    if not root:
+        xdg = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+        root = os.path.join(xdg, 'manim_ace')
+    path = Path(root, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,120 @@
+from manim import *
+from manim import __version__ as manim_version
+
+import hashlib
+import inspect
+import os
+import pickle
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .cache import cache_dir
+
+_CHECKPOINT_VERSION = 2
+# Once the checkpoints take more room than this, the least recently used
+# ones are deleted
+MAX_CHECKPOINT_BYTES = 2 ** 30
+
+
+@lru_cache(maxsize=None)
+def _manim_ace_hash() -> str:
+    """Changes whenever any of manim_ace's own code does."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob('*.py')):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _build_source(build) -> str:
+    try:
+        return inspect.getsource(build)
+    except (OSError, TypeError):
+        # Defined somewhere without source, like a REPL
+        return repr(getattr(build, '__code__', build))
+
+
+def checkpoint_key(previous_key: str, scene_name: str, section_name: str,
+                   build, saved: tuple, inputs=None) -> Optional[str]:
+    """Identifies the state of a scene after a checkpointed section.
+
+    Each key includes the one before it, so changing a section also
+    invalidates the checkpoints of every section after it. saved is the
+    names of the scene attributes the checkpoint holds, and inputs whatever
+    else build depends on. Changes to code build calls outside of manim_ace
+    are not noticed. Returns None if inputs cannot be pickled.
+    """
+    try:
+        inputs = hashlib.sha256(pickle.dumps(
+            inputs, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning(f'Not checkpointing {section_name}, its inputs '
+                       f'cannot be pickled: {e}')
+        return None
+    parts = [_CHECKPOINT_VERSION, previous_key, scene_name, section_name,
+             _build_source(build), tuple(saved), inputs, _manim_ace_hash(),
+             manim_version]
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def _checkpoint_file(key: str) -> Path:
+    return cache_dir('checkpoints') / f'{key}.pickle'
+
+
+def save_checkpoint(key: str, state: dict):
+    path = _checkpoint_file(key)
+    temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        _evict(path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        # Updaters and other lambdas cannot be pickled
+        logger.warning(f'Could not save checkpoint to {path}: {e}')
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _evict(keep: Path):
+    """Deletes the least recently used checkpoints (but never keep) until
+    they fit in MAX_CHECKPOINT_BYTES."""
+    checkpoints = []
+    for path in keep.parent.glob('*.pickle'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        checkpoints.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in checkpoints)
+    for _, size, path in sorted(checkpoints):
+        if total <= MAX_CHECKPOINT_BYTES:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+def load_checkpoint(key: str) -> Optional[dict]:
+    """Returns the state saved by save_checkpoint, if any."""
+    path = _checkpoint_file(key)
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        # Marks it as recently used for _evict
+        os.utime(path)
+        return state
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError) as e:
+        logger.warning(f'Ignoring unreadable checkpoint {key}: {e}')
+        return None
@@ -1,12 +1,20 @@
 from manim import *
+from manim import __version__ as manim_version
 
+import hashlib
+import json
+import os
+import pickle
 import re
 
-from typing import Optional
+from colour import Color
+from typing import NamedTuple, Optional
 
+from .animations import FadeOpacity, fade_opacity
+from .cache import cache_dir
 from .colors import (BLACK_07, IBM_CYAN_20, IBM_RED_20, IBM_PURPLE_30,
                      USER_FUNCTION_COLOR, BLACK_12)
-from .fonts import ROBOTO_MONO
+from .fonts import ROBOTO_MONO, resolve_font
 
 FOR_SCOPE_COLOR = BLACK_07
 NESTED_SCOPE_COLOR = BLACK_12
@@ -14,6 +22,8 @@ IF_SCOPE_COLOR = IBM_CYAN_20
 ELSE_SCOPE_COLOR = IBM_RED_20
 ELIF_SCOPE_COLOR = IBM_PURPLE_30
 
+CODE_STYLE = "xcode"
+
 
 class CodeWithPalette(Code):
     def _gen_code_json(self):
@@ -29,62 +39,265 @@ class CodeWithPalette(Code):
                 entry[1] = palette_swap.get(entry[1], entry[1])
 
 
+def _code_kwargs(tab_width: int) -> dict:
+    """What build_code_lines passes to Code, other than the code."""
+    return dict(
+        # The default for rendered indentation is 3 (ick).
+        tab_width=tab_width,
+        # Indentation of this type will be converted to tabs before rendering.
+        # For convenience, align it to the rendered width so the input source
+        # code aligns with the rendered version.
+        indentation_chars=" " * tab_width,
+        line_spacing=0.6,
+        background_stroke_width=1,
+        background_stroke_color=GREY,
+        insert_line_no=True,
+        style=CODE_STYLE,
+        background="rectangle",
+        language="python",
+        font=resolve_font(ROBOTO_MONO),
+        name="source_code",
+    )
+
+
+def _tidy_lines(labels: [VGroup], lines: [VGroup], start_at_line: int):
+    for i in range(0, len(labels)):
+        # Line numbers with 1 in the low digit are a bit
+        # wonky, alignment wise.
+        if (i + start_at_line) % 10 == 1:
+            labels[i].shift(LEFT * 0.04)
+        # Reduce the gap between line and code a bit
+        labels[i].shift(RIGHT * 0.1)
+
+        # Code turns leading tabs or spaces into invisible Dots.
+        # These Dots are not located properly either (as of v0.17.2)
+        # This is non-intuitive, so we remove them.
+        to_remove = []
+        for j in range(0, len(lines[i])):
+            if type(lines[i][j]) == Dot:
+                to_remove.append(lines[i][j])
+            else:
+                break
+        lines[i].remove(*to_remove)
+
+
+def build_code_lines(source_code: str, tab_width: int,
+                     start_at_line: int) -> ([VGroup], [VGroup]):
+    """Highlights and renders source_code, returning the line number labels
+    and the lines of code."""
+    code = CodeWithPalette(code=source_code, line_no_from=start_at_line,
+                           **_code_kwargs(tab_width))
+    # Ignore outline (code[0])
+    labels, lines = list(code[1]), list(code[2])
+    _tidy_lines(labels, lines, start_at_line)
+    return labels, lines
+
+
+class CodeTokens(NamedTuple):
+    # [[text, color], ...] for each line, as in Code.code_json
+    lines: list
+    # How many indents each line starts with
+    indents: list
+    background_color: str
+    default_color: str
+
+
+def code_tokens(source_code: str, tab_width: int) -> CodeTokens:
+    """Highlights source_code the way Code does, without rendering it."""
+    code = CodeWithPalette.__new__(CodeWithPalette)
+    code.code_string = source_code
+    code.language = "python"
+    code.style = CODE_STYLE
+    code.insert_line_no = True
+    code.line_no_from = 1
+    code.indentation_chars = " " * tab_width
+    code.file_path = None
+    code.file_name = None
+    code.generate_html_file = False
+    code._gen_html_string()
+    # As in Code.__init__
+    strati = code.html_string.find("background:")
+    code.background_color = code.html_string[strati + 12:strati + 19]
+    code._gen_code_json()
+    return CodeTokens(code.code_json, code.tab_spaces,
+                      code.background_color, code.default_color)
+
+
+# A line that starts and ends every chunk, the same in all of them, so the
+# chunks can be lined up with each other
+_ANCHOR = "M"
+_LABEL_ANCHOR = "0"
+
+
+class _CodeChunk(CodeWithPalette):
+    """Lines start to end of a longer source, highlighted as part of the
+    whole of it, between two anchor lines."""
+
+    def __init__(self, tokens: CodeTokens, start: int, end: int, **kwargs):
+        self.tokens = tokens
+        self.chunk = (start, end)
+        # The code is only checked to not be empty, see _gen_code_json
+        super().__init__(code=_ANCHOR, **kwargs)
+
+    def _gen_html_string(self):
+        # Only the background color is read from it
+        self.html_string = f"background: {self.tokens.background_color}"
+
+    def _gen_code_json(self):
+        start, end = self.chunk
+        anchor = [[_ANCHOR, self.tokens.default_color]]
+        self.default_color = self.tokens.default_color
+        self.code_json = [anchor] + self.tokens.lines[start:end] + [anchor]
+        self.tab_spaces = [0] + self.tokens.indents[start:end] + [0]
+
+    def _gen_line_numbers(self):
+        numbers = [str(self.line_no_from + i) for i in range(0, len(self.code_json) - 2)]
+        line_numbers = Paragraph(
+            _LABEL_ANCHOR, *numbers, _LABEL_ANCHOR,
+            line_spacing=self.line_spacing,
+            alignment="right",
+            font_size=self.font_size,
+            font=self.font,
+            disable_ligatures=True,
+            stroke_width=self.stroke_width,
+        )
+        for label in line_numbers:
+            label.set_color(self.default_color)
+        return line_numbers
+
+
+def build_code_chunk(tokens: CodeTokens, start: int, end: int, tab_width: int,
+                     start_at_line: int) -> ([VGroup], [VGroup]):
+    """Renders lines start to end (0 based, end exclusive) of the code,
+    returning the line number labels and lines of code with an anchor line
+    before and after them."""
+    code = _CodeChunk(tokens, start, end, line_no_from=start + start_at_line,
+                      **_code_kwargs(tab_width))
+    labels, lines = list(code[1]), list(code[2])
+    _tidy_lines(labels[1:-1], lines[1:-1], start + start_at_line)
+    return labels, lines
+
+
+# Bump this if build_code_lines or what is saved changes
+_CODE_CACHE_VERSION = 3
+
+_SAVED_ATTRS = ['fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas',
+                'stroke_width', 'background_stroke_width',
+                'sheen_factor', 'sheen_direction']
+
+
+def code_window_key(source_code: str, tab_width: int, start_at_line: int,
+                    chunk: Optional[tuple] = None) -> str:
+    """Identifies everything that goes into build_code_lines, or into
+    build_code_chunk for the (start, end) chunk."""
+    parts = [_CODE_CACHE_VERSION, source_code, tab_width, start_at_line,
+             CODE_STYLE, resolve_font(ROBOTO_MONO), manim_version]
+    if chunk is not None:
+        parts.append(list(chunk))
+    return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+def _freeze(mobj: Mobject) -> dict:
+    return {
+        'points': mobj.points,
+        'attrs': {attr: getattr(mobj, attr) for attr in _SAVED_ATTRS
+                  if hasattr(mobj, attr)},
+        'children': [_freeze(child) for child in mobj.submobjects],
+        # Empty lines are still groups
+        'group': isinstance(mobj, VGroup),
+        # Colors cannot be pickled, so this is a hex string
+        'color': (None if getattr(mobj, 'color', None) is None
+                  else Color(mobj.color).hex_l),
+    }
+
+
+def _thaw(frozen: dict) -> VMobject:
+    if frozen['group']:
+        mobj = VGroup(*[_thaw(child) for child in frozen['children']])
+    else:
+        mobj = VMobject()
+    mobj.points = frozen['points']
+    for attr, value in frozen['attrs'].items():
+        setattr(mobj, attr, value)
+    # What each token was colored, as Text leaves it
+    mobj.color = None if frozen['color'] is None else Color(frozen['color'])
+    return mobj
+
+
+def plain_code_lines(labels: [VGroup], lines: [VGroup]) -> ([VGroup], [VGroup]):
+    """The same labels and lines, made of the plain VGroups and VMobjects
+    load_code_lines gives, so they do not depend on whether the cache was
+    hit."""
+    return ([_thaw(_freeze(label)) for label in labels],
+            [_thaw(_freeze(line)) for line in lines])
+
+
+def _code_cache_file(key: str):
+    return cache_dir('code_windows') / f'{key}.pickle'
+
+
+def save_code_lines(key: str, labels: [VGroup], lines: [VGroup]):
+    frozen = {
+        'labels': [_freeze(label) for label in labels],
+        'lines': [_freeze(line) for line in lines],
+    }
+    path = _code_cache_file(key)
+    temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump(frozen, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f'Could not save code window to {path}: {e}')
+
+
+def load_code_lines(key: str) -> Optional[tuple]:
+    """Returns the labels and lines saved by save_code_lines, if any."""
+    try:
+        with open(_code_cache_file(key), 'rb') as f:
+            frozen = pickle.load(f)
+        return ([_thaw(label) for label in frozen['labels']],
+                [_thaw(line) for line in frozen['lines']])
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError) as e:
+        logger.warning(f'Ignoring unreadable code window cache {key}: {e}')
+        return None
+
+
 class CodeWindow(VDict):
+    # Set to False to always run Pygments and Pango instead of
+    # loading previously built code from disk.
+    use_disk_cache = True
+
     def __init__(self, source_code: str, tab_width: int = 4,
                  start_at_line=1):
         super().__init__()
         self.line_offset = start_at_line - 1
-
-        code = CodeWithPalette(
-            code=source_code,
-            # The default for rendered indentation is 3 (ick).
-            tab_width=tab_width,
-            # Indentation of this type will be converted to tabs before rendering.
-            # For convenience, align it to the rendered width so the input source
-            # code aligns with the rendered version.
-            indentation_chars=" " * tab_width,
-            line_spacing=0.6,
-            background_stroke_width=1,
-            background_stroke_color=GREY,
-            insert_line_no=True,
-            style="xcode",
-            background="rectangle",
-            language="python",
-            font=ROBOTO_MONO,
-            name="source_code",
-            line_no_from=start_at_line,
-        )
         self.indent_chars = tab_width
 
-        # Ignore outline (code[0])
-        for i in range(0, len(code[1])):
-            # Line numbers with 1 in the low digit are a bit
-            # wonky, alignment wise.
-            if (i + start_at_line) % 10 == 1:
-                code[1][i].shift(LEFT * 0.04)
-            # Reduce the gap between line and code a bit
-            code[1][i].shift(RIGHT * 0.1)
-
-            # Code turns leading tabs or spaces into invisible Dots.
-            # These Dots are not located properly either (as of v0.17.2)
-            # This is non-intuitive, so we remove them.
-            to_remove = []
-            for j in range(0, len(code[2][i])):
-                if type(code[2][i][j]) == Dot:
-                    to_remove.append(code[2][i][j])
-                else:
-                    break
-            code[2][i].remove(*to_remove)
+        key = code_window_key(source_code, tab_width, start_at_line)
+        labels_and_lines = None
+        if self.use_disk_cache:
+            labels_and_lines = load_code_lines(key)
+        if labels_and_lines is None:
+            labels_and_lines = build_code_lines(source_code, tab_width,
+                                                start_at_line)
+            if self.use_disk_cache:
+                save_code_lines(key, *labels_and_lines)
+            labels_and_lines = plain_code_lines(*labels_and_lines)
+        labels, lines = labels_and_lines
 
+        for i in range(0, len(lines)):
             self.add([
-                (f"label_{i + start_at_line}", code[1][i]),
-                (f"line_{i + start_at_line}", code[2][i]),
+                (f"label_{i + start_at_line}", labels[i]),
+                (f"line_{i + start_at_line}", lines[i]),
             ])
-        self.total_lines = len(code[1])
+        self.total_lines = len(labels)
         self.scopes = VGroup()
         # Insert it in front of the background behind everything else
         self.submobjects.insert(0, self.scopes)
-        self.code_area = code[2]
+        self.code_area = VGroup(*lines)
 
     def line_width(self) -> float:
         """Returns the maximum width of a line of code."""
@@ -142,4 +355,298 @@ class CodeWindow(VDict):
         new_scope = VGroup(scope_lines, scope_kw)
         new_scope.set_opacity(0)
         self.add_scope_rectangle(f'scope_{line}', new_scope)
-        return new_scope.animate.set_opacity(1.0)
+        return FadeOpacity(new_scope)
+
+
+class ScrollCode(Animation):
+    """Scrolls the lines of a ScrollingCodeWindow, fading in the lines that
+    come into view and fading out (then hiding) the ones that leave it.
+    Scope rectangles are faded in and out with their lines, but stay in the
+    window so they keep scrolling with it. Made by
+    ScrollingCodeWindow.scroll_to."""
+
+    def __init__(self, window: 'ScrollingCodeWindow', offset: np.ndarray,
+                 entering: [int], leaving: [int],
+                 entering_scopes: [Mobject] = [], leaving_scopes: [Mobject] = [],
+                 **kwargs):
+        self.offset = offset
+        self.leaving = leaving
+        self.done = 0.0
+        super().__init__(window, **kwargs)
+        self.content = [window.scopes]
+        for i in window.shown:
+            self.content += window.built[i]
+        entering_mobjects = [mobj for i in entering for mobj in window.built[i]]
+        for mobj in entering_mobjects:
+            mobj.set_opacity(0)
+        # Played as part of this, so they do not need their own begin and
+        # finish
+        fade_args = dict(rate_func=self.rate_func, suspend_mobject_updating=False)
+        self.fade_ins = fade_opacity(entering_mobjects + list(entering_scopes), 1,
+                                     **fade_args)
+        self.fade_outs = fade_opacity([mobj for i in leaving for mobj in window.built[i]],
+                                      0, **fade_args)
+        # Left faded out, until their lines come back
+        self.scope_fade_outs = fade_opacity(leaving_scopes, 0, **fade_args)
+        self.fades = self.fade_ins + self.fade_outs + self.scope_fade_outs
+
+    def create_starting_mobject(self) -> Mobject:
+        # Everything is moved in place
+        return self.mobject
+
+    def begin(self):
+        self.done = 0.0
+        for fade in self.fades:
+            fade.begin()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        done = self.rate_func(alpha)
+        for mobj in self.content:
+            mobj.shift(self.offset * (done - self.done))
+        self.done = done
+        for fade in self.fades:
+            fade.interpolate_mobject(alpha)
+
+    def clean_up_from_scene(self, scene: Scene):
+        super().clean_up_from_scene(scene)
+        for fade in self.fade_outs:
+            # Back to how they were, for when they are shown again
+            fade.interpolate_mobject(0)
+        self.mobject.hide_lines(self.leaving)
+
+
+class ScrollingCodeWindow(CodeWindow):
+    """A CodeWindow for long code, which shows visible_lines lines of it at
+    a time and scrolls to follow the program counter.
+
+    Only the lines in (or within margin lines of) the view are rendered,
+    chunk_lines at a time. The rest are kept as highlighted tokens until
+    they are scrolled to or looked up. Each chunk is rendered between two
+    anchor lines, and lined up with the first chunk by its anchors.
+
+    Lines out of view are not part of the window, so they do not move with
+    it. Where their anchors are is worked out from their labels whenever
+    they are placed.
+    """
+
+    def __init__(self, source_code: str, tab_width: int = 4,
+                 start_at_line=1, visible_lines: int = 20, margin: int = 5,
+                 chunk_lines: int = 20):
+        VDict.__init__(self)
+        self.line_offset = start_at_line - 1
+        self.indent_chars = tab_width
+        self.source_code = source_code
+        self.tokens = code_tokens(source_code, tab_width)
+        self.total_lines = len(self.tokens.lines)
+        self.visible_lines = min(visible_lines, self.total_lines)
+        self.margin = margin
+        self.chunk_lines = chunk_lines
+        # Index (0 based) of the first line in view
+        self.top = 0
+        # Index -> [label, line] of the lines rendered so far
+        self.built = {}
+        # Index -> (label anchor, line anchor, label height) of each
+        # rendered line as it was built, with the anchors relative to the
+        # center of its label
+        self.handles = {}
+        # Indices of the lines that are in the VDict
+        self.shown = []
+        # Key -> (first, last) index of the lines each scope rectangle spans
+        self.scope_spans = {}
+        # Keys of the scope rectangles faded out because their lines are
+        # out of view
+        self.hidden_scopes = set()
+        # The chunks rendered so far
+        self.chunks = set()
+        self.scopes = VGroup()
+        # Insert it in front of the background behind everything else
+        self.submobjects.insert(0, self.scopes)
+
+        labels, lines = self._build_chunk(0)
+        # The first chunk is where everything is lined up to. Its anchors
+        # are one line above and below it.
+        step = ((lines[-1].get_center() - lines[0].get_center())
+                / (len(lines) - 1))
+        self.line_height = np.linalg.norm(step)
+        # Where the first line in view would have each anchor, where the
+        # one after would have the line anchor, and the left of the code.
+        # Kept as points so they move with the window.
+        self.reference = VMobject(stroke_width=0, fill_opacity=0)
+        self.reference.points = np.array([
+            labels[0].get_center() + step,
+            lines[0].get_center() + step,
+            lines[0].get_center() + 2 * step,
+            lines[0].get_left() + step,
+        ])
+        self.add([("reference", self.reference)])
+        self.show_lines(range(0, self.visible_lines))
+        self._prefetch()
+
+    def _build_chunk(self, chunk: int) -> ([VGroup], [VGroup]):
+        start = chunk * self.chunk_lines
+        end = min(start + self.chunk_lines, self.total_lines)
+        key = code_window_key(self.source_code, self.indent_chars,
+                              self.line_offset + 1, (start, end))
+        labels_and_lines = None
+        if self.use_disk_cache:
+            labels_and_lines = load_code_lines(key)
+        if labels_and_lines is None:
+            labels_and_lines = build_code_chunk(self.tokens, start, end,
+                                                self.indent_chars,
+                                                self.line_offset + 1)
+            if self.use_disk_cache:
+                save_code_lines(key, *labels_and_lines)
+            labels_and_lines = plain_code_lines(*labels_and_lines)
+        labels, lines = labels_and_lines
+
+        label_anchor, line_anchor = labels[0].get_center(), lines[0].get_center()
+        self.chunks.add(chunk)
+        for i in range(start, end):
+            label, line = labels[i - start + 1], lines[i - start + 1]
+            self.built[i] = [label, line]
+            center = label.get_center()
+            self.handles[i] = (label_anchor - center, line_anchor - center,
+                               label.height)
+        return labels, lines
+
+    def _prefetch(self):
+        """Renders the chunks of the lines within margin of the view."""
+        first = max(0, self.top - self.margin)
+        last = min(self.total_lines, self.top + self.visible_lines + self.margin) - 1
+        for chunk in range(first // self.chunk_lines, last // self.chunk_lines + 1):
+            if chunk not in self.chunks:
+                self._build_chunk(chunk)
+
+    def _place(self, i: int, top: int):
+        """Moves line i to where it goes when line top is the first in
+        view."""
+        if i not in self.built:
+            self._build_chunk(i // self.chunk_lines)
+        label_at, line_at, next_line_at, _ = self.reference.points
+        step = next_line_at - line_at
+        # The chunk's anchor is on the line before its first
+        slot = (i // self.chunk_lines) * self.chunk_lines - 1 - top
+        scale = np.linalg.norm(step) / self.line_height
+
+        # The label and line have only ever been moved together, so the
+        # label says where both anchors are now
+        label = self.built[i][0]
+        label_anchor, line_anchor, height = self.handles[i]
+        old_scale = label.height / height
+        center = label.get_center()
+        old = (center + label_anchor * old_scale, center + line_anchor * old_scale)
+        for mobj, old_anchor, anchor in zip(self.built[i], old,
+                                            (label_at + slot * step, line_at + slot * step)):
+            mobj.scale(scale / old_scale, about_point=old_anchor)
+            mobj.shift(anchor - old_anchor)
+
+    def _keys(self, i: int) -> (str, str):
+        number = i + 1 + self.line_offset
+        return f"label_{number}", f"line_{number}"
+
+    def show_lines(self, indices, top: Optional[int] = None):
+        """Adds lines to the VDict, as they are when line top (by default,
+        the one that is) is the first in view."""
+        for i in indices:
+            if i in self.shown:
+                continue
+            self._place(i, self.top if top is None else top)
+            self.add(list(zip(self._keys(i), self.built[i])))
+            self.shown.append(i)
+
+    def hide_lines(self, indices):
+        for i in indices:
+            if i not in self.shown:
+                continue
+            for key in self._keys(i):
+                self.remove(key)
+            self.shown.remove(i)
+
+    def __getitem__(self, key):
+        match = re.fullmatch(r"(label|line)_(\d+)", key) if isinstance(key, str) else None
+        if match and key not in self.submob_dict:
+            i = int(match.group(2)) - 1 - self.line_offset
+            if 0 <= i < self.total_lines:
+                # Where it would be, were it in view
+                self._place(i, self.top)
+                return self.built[i][0 if match.group(1) == "label" else 1]
+        return super().__getitem__(key)
+
+    def in_view(self, line: int) -> bool:
+        i = line - 1 - self.line_offset
+        return self.top <= i < self.top + self.visible_lines
+
+    def scroll_to(self, line: int, last_line: Optional[int] = None) -> Optional[ScrollCode]:
+        """Scrolls so line (numbered as in the labels), and every line up to
+        last_line if given, is in view. Returns None if they already are."""
+        if last_line is None:
+            last_line = line
+        assert last_line - line < self.visible_lines, (
+            f'Lines {line} to {last_line} do not fit in a view of '
+            f'{self.visible_lines} lines')
+        if self.in_view(line) and self.in_view(last_line):
+            return None
+        i = line - 1 - self.line_offset
+        last = last_line - 1 - self.line_offset
+        old_top = self.top
+        # Leave a little of what comes before it in view
+        self.top = max(i - self.visible_lines // 4, last - self.visible_lines + 1)
+        self.top = max(0, min(self.top, i, self.total_lines - self.visible_lines))
+        old_view = range(old_top, old_top + self.visible_lines)
+        new_view = range(self.top, self.top + self.visible_lines)
+        entering = [j for j in new_view if j not in old_view]
+        leaving = [j for j in old_view if j not in new_view]
+
+        entering_scopes, leaving_scopes = [], []
+        for key, (first, last) in self.scope_spans.items():
+            in_view = first < self.top + self.visible_lines and last >= self.top
+            if in_view and key in self.hidden_scopes:
+                self.hidden_scopes.remove(key)
+                entering_scopes.append(self.submob_dict[key])
+            elif not in_view and key not in self.hidden_scopes:
+                self.hidden_scopes.add(key)
+                leaving_scopes.append(self.submob_dict[key])
+
+        self.show_lines(entering, top=old_top)
+        label_at, line_at, next_line_at, _ = self.reference.points
+        offset = (next_line_at - line_at) * (old_top - self.top)
+        scroll = ScrollCode(self, offset, entering, leaving,
+                            entering_scopes, leaving_scopes)
+        self._prefetch()
+        return scroll
+
+    def highlight_scope(self, scope_type: str, lines: int, indents: int,
+                        line: int, start: int, end: int,
+                        body_lines_offset=1) -> Animation:
+        """As CodeWindow.highlight_scope, scrolling first if the scope is not
+        all in view. Scopes longer than the view are not supported."""
+        last_line = line + body_lines_offset + lines - 1
+        scroll = self.scroll_to(line, last_line)
+        highlight = super().highlight_scope(scope_type, lines, indents, line,
+                                            start, end, body_lines_offset)
+        self.scope_spans[f'scope_{line}'] = (line - 1 - self.line_offset,
+                                             last_line - 1 - self.line_offset)
+        if scroll is None:
+            return highlight
+        # The scope is made where the lines are now and scrolls with them.
+        # Grouped by the window so manim does not add a Group of its own.
+        return AnimationGroup(scroll, highlight, group=self)
+
+    def line_width(self) -> float:
+        """Returns the maximum width of a line of code, rendering only the
+        longest one."""
+        tokens = self.tokens
+
+        def columns(i):
+            return (tokens.indents[i] * self.indent_chars
+                    + sum(len(text) for text, _ in tokens.lines[i]))
+        longest = max(range(0, self.total_lines), key=columns)
+        line = self[self._keys(longest)[1]]
+        return line.get_right()[0] - self.reference.points[3][0]
+
+    @property
+    def code_area(self) -> Mobject:
+        """Spans all the columns of the code, for lining things up with."""
+        left = self.reference.points[3]
+        return Line(left, left + RIGHT * self.line_width())
@@ -0,0 +1,192 @@
+from manim import *
+
+import math
+
+from typing import Optional
+
+# How far (in pixels) Cairo's antialiasing can reach past a mobject's path,
+# on top of half its stroke.
+_PADDING = 2
+# The largest difference check mode allows between a pixel of the two frames
+_CHECK_TOLERANCE = 1
+
+
+def _bounds(mobj: Mobject) -> np.ndarray:
+    """[[min x, min y], [max x, max y]] of mobj's own points."""
+    points = mobj.points[:, :2]
+    return np.array([points.min(axis=0), points.max(axis=0)])
+
+
+def _stroke(mobj: Mobject) -> float:
+    return max(getattr(mobj, 'stroke_width', 0) or 0,
+               getattr(mobj, 'background_stroke_width', 0) or 0)
+
+
+class DirtyRegions:
+    """Redraws only the part of each frame that the animations change.
+
+    The first frame of each play is drawn as usual. For the rest, the box
+    around everything being animated (where it is now and where it was on
+    the last frame) is reset to the still background, and only the moving
+    mobjects that overlap it are drawn again, clipped to it. Outside the
+    box, the last frame is kept.
+
+    Moving the camera, mobjects with background images and anything that
+    is not a VMobject fall back to drawing whole frames. With check=True,
+    every partial frame is compared against a whole one.
+    """
+
+    def __init__(self, scene: Scene, check: bool = False):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.camera = scene.renderer.camera
+        self.check = check
+        self.full_frames = 0
+        self.partial_frames = 0
+        # Fraction of the frame redrawn, summed over partial frames
+        self.redrawn = 0.0
+
+        self._play = -1
+        self._last_box = None
+        # id -> bounds of moving mobjects that are not animated, per play
+        self._still_bounds = {}
+        # (x0, y0, x1, y1) in pixels that Cairo may draw in
+        self._clip = None
+
+        self._render = self.renderer.render
+        self.renderer.render = self.render
+        self._get_cairo_context = self.camera.get_cairo_context
+        self.camera.get_cairo_context = self.get_cairo_context
+
+    def get_cairo_context(self, pixel_array: np.ndarray):
+        ctx = self._get_cairo_context(pixel_array)
+        # Contexts can be cached, so never leave a clip behind
+        ctx.reset_clip()
+        if self._clip is not None:
+            x0, y0, x1, y1 = self._clip
+            matrix = ctx.get_matrix()
+            ctx.identity_matrix()
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+            ctx.clip()
+            ctx.set_matrix(matrix)
+        return ctx
+
+    def _changing(self, scene: Scene, moving_mobjects: [Mobject]) -> Optional[list]:
+        """The mobjects that can look different on each frame of this play,
+        or None if the whole frame has to be drawn."""
+        animated = []
+        animations = list(scene.animations)
+        while animations:
+            anim = animations.pop()
+            animated.append(anim.mobject)
+            # A group's own mobject need not hold everything it animates
+            animations += getattr(anim, 'animations', [])
+        animated += [m for m in moving_mobjects if m.updaters]
+        family = extract_mobject_family_members(animated, only_those_with_points=True)
+        frame = getattr(self.camera, 'frame', None)
+        if frame is not None and frame in extract_mobject_family_members(animated):
+            return None
+        return family
+
+    def _pixel_box(self, bounds: np.ndarray, stroke: float) -> tuple:
+        camera = self.camera
+        x_scale = camera.pixel_width / camera.frame_width
+        y_scale = camera.pixel_height / camera.frame_height
+        center = camera.frame_center
+        pad = math.ceil(stroke * camera.cairo_line_width_multiple * x_scale / 2) + _PADDING
+        x0 = (bounds[0][0] - center[0]) * x_scale + camera.pixel_width / 2
+        x1 = (bounds[1][0] - center[0]) * x_scale + camera.pixel_width / 2
+        y0 = camera.pixel_height / 2 - (bounds[1][1] - center[1]) * y_scale
+        y1 = camera.pixel_height / 2 - (bounds[0][1] - center[1]) * y_scale
+        return (max(0, math.floor(x0) - pad), max(0, math.floor(y0) - pad),
+                min(camera.pixel_width, math.ceil(x1) + pad),
+                min(camera.pixel_height, math.ceil(y1) + pad))
+
+    def _box(self, mobjects: [Mobject]) -> Optional[tuple]:
+        """The pixels mobjects cover, or None if they cover none."""
+        if not mobjects:
+            return None
+        bounds = np.array([_bounds(m) for m in mobjects])
+        return self._pixel_box(np.array([bounds[:, 0].min(axis=0),
+                                         bounds[:, 1].max(axis=0)]),
+                               max(_stroke(m) for m in mobjects))
+
+    def render(self, scene: Scene, time: float, moving_mobjects: [Mobject]):
+        renderer = self.renderer
+        if renderer.skip_animations:
+            return self._render(scene, time, moving_mobjects)
+
+        new_play = renderer.num_plays != self._play
+        if new_play:
+            self._play = renderer.num_plays
+            self._still_bounds = {}
+        changing = self._changing(scene, moving_mobjects)
+        drawn = [m for m in moving_mobjects if m.has_points()]
+        simple = changing is not None and all(
+            isinstance(m, VMobject) and not m.get_background_image() for m in drawn)
+        box = self._box(changing) if simple else None
+        last_box = self._last_box
+        self._last_box = box
+
+        if new_play or not simple:
+            self.full_frames += 1
+            return self._render(scene, time, moving_mobjects)
+
+        dirty = _union(box, last_box)
+        if dirty is not None:
+            self._draw(dirty, drawn, changing)
+            self.redrawn += ((dirty[2] - dirty[0]) * (dirty[3] - dirty[1])
+                             / (self.camera.pixel_width * self.camera.pixel_height))
+        self.partial_frames += 1
+        frame = renderer.get_frame()
+        if self.check:
+            renderer.update_frame(scene, moving_mobjects)
+            full = renderer.get_frame()
+            difference = np.abs(full.astype(int) - frame.astype(int))
+            assert difference.max() <= _CHECK_TOLERANCE, (
+                f'Partial frame differs from the whole frame by up to '
+                f'{difference.max()} in {np.count_nonzero(difference.max(axis=2))} '
+                f'pixels (redrew {dirty})')
+            frame = full
+        renderer.add_frame(frame)
+
+    def _draw(self, dirty: tuple, drawn: [Mobject], changing: [Mobject]):
+        x0, y0, x1, y1 = dirty
+        background = self.renderer.static_image
+        if background is None:
+            background = self.camera.background
+        self.camera.pixel_array[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+
+        changing_ids = set(map(id, changing))
+        visible = []
+        for mobj in drawn:
+            if id(mobj) in changing_ids:
+                box = self._pixel_box(_bounds(mobj), _stroke(mobj))
+            else:
+                box = self._still_bounds.get(id(mobj))
+                if box is None:
+                    box = self._pixel_box(_bounds(mobj), _stroke(mobj))
+                    self._still_bounds[id(mobj)] = box
+            if box[0] < x1 and box[2] > x0 and box[1] < y1 and box[3] > y0:
+                visible.append(mobj)
+
+        self._clip = dirty
+        try:
+            self.camera.capture_mobjects(visible, include_submobjects=False)
+        finally:
+            self._clip = None
+
+    def stats(self) -> dict:
+        return {
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'redrawn': self.redrawn / self.partial_frames if self.partial_frames else 0.0,
+        }
+
+
+def _union(a: Optional[tuple], b: Optional[tuple]) -> Optional[tuple]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
@@ -1,7 +1,118 @@
+import json
+import os
 import sys
 
+from functools import lru_cache
+from pathlib import Path
+
+from .cache import cache_dir
+
 LM_MONO = "Latin Modern Mono"
 if sys.platform == "win32":
     # Windows names this font differently for unknown reasons
     LM_MONO = "LM Mono 10"
-ROBOTO_MONO = "Roboto Mono"
\ No newline at end of file
+ROBOTO_MONO = "Roboto Mono"
+
+# Tried in order by resolve_font when a font is not installed.
+FALLBACK_FONTS = {
+    LM_MONO: ["Latin Modern Mono", "LM Mono 10", "DejaVu Sans Mono",
+              "Courier New", "Monospace"],
+    ROBOTO_MONO: ["Roboto Mono", "DejaVu Sans Mono", "Courier New",
+                  "Monospace"],
+}
+
+_CACHE_VERSION = 1
+
+
+def _font_config_stamp() -> list:
+    """Modification times of the places that change when fonts are
+    installed. If none of these change, neither has the list of fonts."""
+    candidates = [
+        os.path.join(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'), 'fontconfig'),
+        '/var/cache/fontconfig',
+        '/usr/lib/fontconfig/cache',
+        # Fonts copied in without running fc-cache
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        os.path.join(os.environ.get('XDG_DATA_HOME', Path.home() / '.local' / 'share'), 'fonts'),
+        Path.home() / '.fonts',
+        Path.home() / 'Library' / 'Fonts',
+        '/Library/Fonts',
+        os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+        os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'),
+    ]
+    stamp = []
+    for path in candidates:
+        try:
+            stamp.append([str(path), os.stat(path).st_mtime])
+        except OSError:
+            pass
+    return stamp
+
+
+def _cache_file() -> Path:
+    return cache_dir() / 'fonts.json'
+
+
+@lru_cache(maxsize=None)
+def available_fonts() -> frozenset:
+    """The fonts Pango can use.
+
+    Listing system fonts is slow, so this is done at most once per process
+    and the result is kept on disk until fontconfig's cache changes.
+    """
+    stamp = _font_config_stamp()
+    # Without a stamp we cannot tell when the disk cache is out of date
+    if stamp:
+        try:
+            with open(_cache_file()) as f:
+                cached = json.load(f)
+            if cached['version'] == _CACHE_VERSION and cached['stamp'] == stamp:
+                return frozenset(cached['fonts'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    import manimpango
+    fonts = manimpango.list_fonts()
+    if stamp:
+        path = _cache_file()
+        # Written to the side and moved into place, so a render running at
+        # the same time never reads half of it
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({'version': _CACHE_VERSION, 'stamp': stamp,
+                           'fonts': sorted(fonts)}, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+    return frozenset(fonts)
+
+
+def has_font(font: str) -> bool:
+    return font in available_fonts()
+
+
+@lru_cache(maxsize=None)
+def resolve_font(font: str) -> str:
+    """Returns font if it is installed, otherwise the first installed fallback.
+
+    If nothing suitable is installed, font is returned anyway and Pango will
+    pick something itself.
+    """
+    if has_font(font):
+        return font
+    for fallback in FALLBACK_FONTS.get(font, []):
+        if has_font(fallback):
+            return fallback
+    return font
+
+
+def forget_fonts():
+    """Use after installing or registering fonts while running."""
+    available_fonts.cache_clear()
+    resolve_font.cache_clear()
+    try:
+        os.remove(_cache_file())
+    except OSError:
+        pass
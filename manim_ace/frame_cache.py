@@ -0,0 +1,156 @@
+from manim import *
+
+import hashlib
+
+from collections import OrderedDict
+from typing import Optional
+
+# Mobject attributes, other than points and colors, that change how it is drawn
+_DRAWN_ATTRS = ('stroke_width', 'background_stroke_width', 'sheen_factor',
+                'sheen_direction', 'z_index', 'background_image',
+                'resampling_algorithm')
+# Camera attributes that change how everything is drawn
+_CAMERA_ATTRS = ('pixel_width', 'pixel_height', 'frame_width', 'frame_height',
+                 'background_color', 'background_opacity',
+                 'cairo_line_width_multiple', 'use_z_index')
+
+
+def _animated(animations: [Animation]) -> [Mobject]:
+    """The mobjects of animations, and of the animations in any groups."""
+    mobjects = []
+    animations = list(animations)
+    while animations:
+        anim = animations.pop()
+        mobjects.append(anim.mobject)
+        animations += getattr(anim, 'animations', [])
+    return mobjects
+
+
+def keep_static(moving: [Mobject], static: [Mobject], marked: [Mobject],
+                animations: [Animation], scene_order: [Mobject]) -> tuple:
+    """Moves the mobjects in the families of marked from moving to static,
+    as long as nothing in their own family is animated or has updaters.
+    Returns the new (moving, static), with static in scene_order.
+
+    Manim counts everything drawn after the first animated mobject as
+    moving, so animating one variable box redraws the whole code window on
+    every frame. The static mobjects are drawn once per play (and with
+    StaticFrameCache, once for as long as they stay the same) and only the
+    moving ones each frame. Static mobjects are drawn before any moving
+    ones, so a marked mobject ends up under the moving mobjects even if it
+    is above them in the scene.
+    """
+    animated = {id(mobj) for mobj in extract_mobject_family_members(
+        [mobj for mobj in _animated(animations) if mobj is not None])}
+    marked = {id(mobj) for mobj in extract_mobject_family_members(marked)}
+    still = []
+    for mobj in moving:
+        if (id(mobj) in marked and not mobj.get_family_updaters()
+                and not any(id(member) in animated for member in mobj.get_family())):
+            still.append(mobj)
+    if not still:
+        return moving, static
+    still_ids = set(map(id, still))
+    order = {id(mobj): i for i, mobj in enumerate(scene_order)}
+    moving = [mobj for mobj in moving if id(mobj) not in still_ids]
+    static = sorted(static + [mobj for mobj in still if mobj.has_points()],
+                    key=lambda mobj: order.get(id(mobj), -1))
+    return moving, static
+
+
+class StaticFrameCache:
+    """Keeps the picture of the mobjects that do not move, across plays.
+
+    For each play, manim draws everything that is not animated once, then
+    draws only the moving mobjects on top of that for each frame. But it
+    draws the still ones again for the next play, even though in a code
+    scene they are nearly always the same: the code, the scopes, the
+    variables that are not changing. This keeps the last few of those
+    pictures, keyed by a hash of exactly what is in them, so any change to
+    a still mobject (or the camera) means drawing it again.
+
+    What counts as still is up to manim, which takes everything drawn after
+    the first animated mobject to be moving. Use the scene's static_layers
+    and mark_static (see keep_static) to keep more out of the per-frame
+    drawing.
+    """
+
+    def __init__(self, renderer, max_frames: int = 4):
+        self.renderer = renderer
+        self.max_frames = max_frames
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        # camera.background and its hash, which is only worked out again
+        # when the camera gets a new background
+        self._background = None
+        self._background_digest = b''
+        self._save_static_frame_data = renderer.save_static_frame_data
+        self._render = renderer.render
+        renderer.save_static_frame_data = self.save_static_frame_data
+        renderer.render = self.render
+
+    def key(self, static_mobjects: [Mobject]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        camera = self.renderer.camera
+        frame = getattr(camera, 'frame', None)
+        if frame is not None:
+            digest.update(frame.points.tobytes())
+        digest.update(np.asarray(camera.frame_center, dtype=float).tobytes())
+        digest.update(repr([str(getattr(camera, attr, None))
+                            for attr in _CAMERA_ATTRS]).encode('utf-8'))
+        background = getattr(camera, 'background', None)
+        if background is not self._background:
+            self._background = background
+            self._background_digest = (b'' if background is None else
+                                       hashlib.blake2b(background.tobytes()).digest())
+        digest.update(self._background_digest)
+        for mobj in static_mobjects:
+            digest.update(mobj.points.tobytes())
+            if isinstance(mobj, AbstractImageMobject):
+                digest.update(mobj.get_pixel_array().tobytes())
+            for attr in ('fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas'):
+                array = getattr(mobj, attr, None)
+                if array is not None:
+                    digest.update(array.tobytes())
+            digest.update(repr([getattr(mobj, attr, None)
+                                for attr in _DRAWN_ATTRS]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def save_static_frame_data(self, scene, static_mobjects) -> Optional[np.ndarray]:
+        renderer = self.renderer
+        if renderer.skip_animations or not static_mobjects:
+            # No frames will be written, so there is nothing to draw for
+            renderer.static_image = None
+            return None
+
+        key = self.key(static_mobjects)
+        image = self._frames.get(key)
+        if image is not None:
+            self.hits += 1
+            self._frames.move_to_end(key)
+            renderer.static_image = image
+            return image
+
+        self.misses += 1
+        image = self._save_static_frame_data(scene, static_mobjects)
+        if image is not None:
+            self._frames[key] = image
+            if len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        return image
+
+    def render(self, scene, time, moving_mobjects):
+        if self.renderer.skip_animations:
+            # add_frame would throw the picture away
+            return
+        self._render(scene, time, moving_mobjects)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'frames': len(self._frames),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
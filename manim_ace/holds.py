@@ -0,0 +1,113 @@
+from manim import *
+
+import subprocess
+
+from manim import __version__
+from manim.scene import scene_file_writer
+
+# Manim 0.18 writes movies with PyAV rather than by piping to ffmpeg
+_PIPES_TO_FFMPEG = tuple(map(int, __version__.split('.')[:2])) < (0, 18)
+
+
+def holds_supported() -> bool:
+    """Whether this version of manim writes movies the way StaticHolds
+    expects."""
+    return _PIPES_TO_FFMPEG
+
+
+class _HoldPopen:
+    """Stands in for the subprocess module in manim's scene_file_writer
+    while it opens the movie pipe for a hold, adding the filter that repeats
+    the first frame to manim's own ffmpeg command."""
+
+    def __init__(self, frames: int):
+        self.frames = frames
+        self.added = False
+
+    def __getattr__(self, name: str):
+        return getattr(subprocess, name)
+
+    def Popen(self, command: list, **kwargs):
+        command = list(command)
+        pad = f'tpad=stop_mode=clone:stop={self.frames - 1}'
+        if command and command[0] == config.ffmpeg_executable and '-i' in command:
+            if '-vf' in command:
+                # e.g. the vflip OpenGL needs
+                i = command.index('-vf') + 1
+                command[i] = f'{command[i]},{pad}'
+            else:
+                # Output options go anywhere before the output file
+                command[-1:-1] = ['-vf', pad]
+            self.added = True
+        return subprocess.Popen(command, **kwargs)
+
+
+class StaticHolds:
+    """Sends each wait or pause that shows a still frame to ffmpeg as one
+    frame.
+
+    Manim draws a still hold once, but then pipes that frame to ffmpeg once
+    per frame of the hold, which for a pause at -qh is ~500MB of identical
+    pixels. Instead, the partial movie file of a hold is opened with a
+    filter that repeats its first frame, and only that frame is written.
+    The movie comes out the same, frame for frame.
+
+    Only works with manim versions that pipe frames to ffmpeg, see
+    holds_supported().
+    """
+
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.file_writer = scene.renderer.file_writer
+        self.holds = 0
+        self.frames_saved = 0
+        # How many frames the open movie pipe turns its one frame into, or 0
+        # if it is an ordinary pipe
+        self._hold_frames = 0
+
+        self._open_movie_pipe = self.file_writer.open_movie_pipe
+        self.file_writer.open_movie_pipe = self.open_movie_pipe
+        self._freeze_current_frame = self.renderer.freeze_current_frame
+        self.renderer.freeze_current_frame = self.freeze_current_frame
+
+    def _frames_in_hold(self) -> int:
+        """How many frames the animation being played holds still for, or 0
+        if it is not a still hold."""
+        scene = self.scene
+        if not scene.animations or not scene.is_current_animation_frozen_frame():
+            return 0
+        # The same sum as CairoRenderer.freeze_current_frame
+        dt = 1 / self.renderer.camera.frame_rate
+        return int(scene.duration / dt)
+
+    def open_movie_pipe(self, file_path=None):
+        frames = self._frames_in_hold()
+        self._hold_frames = 0
+        if frames < 2 or is_png_format():
+            return self._open_movie_pipe(file_path=file_path)
+
+        hold_popen = _HoldPopen(frames)
+        scene_file_writer.subprocess = hold_popen
+        try:
+            self._open_movie_pipe(file_path=file_path)
+        finally:
+            scene_file_writer.subprocess = subprocess
+        if hold_popen.added:
+            self._hold_frames = frames
+
+    def freeze_current_frame(self, duration: float):
+        frames = self._hold_frames
+        if not frames:
+            return self._freeze_current_frame(duration)
+        self._hold_frames = 0
+
+        renderer = self.renderer
+        renderer.add_frame(renderer.get_frame())
+        # ffmpeg writes the rest
+        renderer.time += (frames - 1) / renderer.camera.frame_rate
+        self.holds += 1
+        self.frames_saved += frames - 1
+
+    def stats(self) -> dict:
+        return {'holds': self.holds, 'frames_saved': self.frames_saved}
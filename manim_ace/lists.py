@@ -1,9 +1,20 @@
 from manim import *
+import numpy as np
 
+from typing import Optional
+
+from . import profiling
+from .animations import PointerMove
 from .fonts import LM_MONO
+from .text_cache import cached_text
 
 _EMPTY = '<empty>'
 
+# How create_horizontal_list and create_vertical_list configure their Table
+LINE_CONFIG = {'stroke_width': 2, "color": BLACK}
+H_BUFF = 0.3
+V_BUFF = 0.2
+
 
 class List(VDict):
     def __init__(self, initial_contents=[],
@@ -14,19 +25,12 @@ class List(VDict):
         self.horizontal = horizontal
 
         if len(initial_contents) == 0:
-            data = ['<empty>']
+            data = [_EMPTY]
             # I get paranoid about using an empty list
             # from the default parameters.
             self.contents = []
         else:
-            data = []
-            for item in initial_contents:
-                if isinstance(item, str):
-                    data.append('"' + item + '"')
-                elif isinstance(item, List):
-                    data.append('<list>')
-                else:
-                    data.append(str(item))
+            data = [cell_text(item) for item in initial_contents]
 
         if horizontal:
             two_d_data = [data]
@@ -37,6 +41,11 @@ class List(VDict):
                 two_d_data.append([d])
             name_mobj = create_vertical_list(two_d_data)
 
+        # The table is still at its native scale, so remember how big each
+        # cell is. This lets us lay out new cells without another Table.
+        self.cell_sizes = [(name_mobj[f'index_{i}'].width,
+                            name_mobj[f'index_{i}'].height)
+                           for i in range(0, len(data))]
         self.add(name_mobj.items())
         last = len(initial_contents)
         # For convenience, add div aliases
@@ -56,42 +65,39 @@ class List(VDict):
             key = self.last_alias[1]
         return super().__getitem__(key)
 
+    @profiling.helper
     def animate_append(self, new_item, source=None,
                        new_scale=None, new_align=None):
         if not new_scale:
             new_scale = 1.0
         if not new_align:
             new_align = (self, UL)
-        new_list = List(self.contents + [new_item],
-                        horizontal=self.horizontal)
-        new_list.scale(new_scale).align_to(new_align[0], new_align[1])
-        resize_anims = []
-        for key in ['background_rect', 'top_line', 'bottom_line', 'left_line', 'right_line']:
-            resize_anims.append(Transform(self[key], new_list[key]))
+        new_index = len(self.contents)
+        new_cell = cell_fn(cell_text(new_item))
+        if new_index == 0:
+            sizes = [(new_cell.width, new_cell.height)]
+        else:
+            sizes = self.cell_sizes + [(new_cell.width, new_cell.height)]
+        current_scale = self._current_scale()
+        layout = ListLayout(sizes, self.horizontal)
+        layout.place(new_scale, new_align[0], new_align[1])
 
+        resize_anims = self._relayout_anims(layout, new_index,
+                                            new_scale / current_scale)
+
+        new_cell.scale(new_scale).move_to(layout.centers[new_index])
         copy_anims = []
-        if len(self.contents) == 0:
+        if new_index == 0:
             resize_anims.append(FadeOut(self['index_0'].copy()))
             if source is None:
-                self['index_0'].become(new_list['index_0']).set_opacity(0)
+                self['index_0'].become(new_cell).set_opacity(0)
                 copy_anims.append(self['index_0'].animate.set_opacity(1.0))
             else:
                 self['index_0'].become(source)
-                copy_anims.append(Transform(self['index_0'], new_list['index_0']))
+                copy_anims.append(Transform(self['index_0'], new_cell))
         else:
-            # Relocate existing dividers and items
-            for i in range(1, len(self.contents)):
-                resize_anims.append(Transform(self[f'div_{i - 1}_{i}'],
-                                              new_list[f'div_{i - 1}_{i}']))
-
-            # Relocate existing items
-            for i in range(0, len(self.contents)):
-                resize_anims.append(Transform(self[f'index_{i}'],
-                                              new_list[f'index_{i}']))
-
             # Create the new divider.
-            new_index = len(self.contents)
-            new_div = new_list[f'div_{new_index - 1}_{new_index}'].set_opacity(0)
+            new_div = layout.divider(new_index).set_opacity(0)
             self.add([(f'div_{new_index - 1}_{new_index}', new_div)])
             # This can look a bit strange on Vertical lists if the width
             # changes, but I don't feel like making a better custom Animation
@@ -99,45 +105,101 @@ class List(VDict):
             resize_anims.append(new_div.animate.set_opacity(1.0))
 
             # Create the new item
-            new_item_mobj = new_list[f'index_{new_index}']
-            target_item = new_item_mobj.copy()
+            target_item = new_cell.copy()
             if source is None:
-                new_item_mobj.set_opacity(0)
+                new_cell.set_opacity(0)
             else:
-                new_item_mobj.become(source)
-            self.add([(f'index_{new_index}', new_item_mobj)])
-            copy_anims.append(Transform(new_item_mobj, target_item))
+                new_cell.become(source)
+            self.add([(f'index_{new_index}', new_cell)])
+            copy_anims.append(Transform(new_cell, target_item))
 
         self.contents.append(new_item)
+        self.cell_sizes = sizes
+        self.last_alias = (f'div_{new_index}_{new_index + 1}', self.last_alias[1])
         return resize_anims, copy_anims
 
+    def _current_scale(self) -> float:
+        """How much this list has been scaled since it was created."""
+        native = ListLayout(self.cell_sizes, self.horizontal)
+        return self['top_line'].get_length() / native.width
+
+    def _relayout_anims(self, layout: 'ListLayout', count: int,
+                        scale_by: float, skip=()) -> [Animation]:
+        """Moves the outline and the first count cells (except those in
+        skip) to where layout says they go. Cells are scaled by scale_by."""
+        anims = [Transform(self['background_rect'],
+                           layout.fit(self['background_rect'].copy()))]
+        for key in ['top_line', 'bottom_line', 'left_line', 'right_line']:
+            anims.append(Transform(self[key], layout.line(key)))
+        for i in range(1, count):
+            anims.append(Transform(self[f'div_{i - 1}_{i}'], layout.divider(i)))
+        for i in range(0, count):
+            if i not in skip:
+                target = self[f'index_{i}'].copy()
+                target.scale(scale_by).move_to(layout.centers[i])
+                anims.append(Transform(self[f'index_{i}'], target))
+            if f'back_{i}' in self.submob_dict:
+                anims.append(Transform(self[f'back_{i}'],
+                                       layout.fit(self[f'back_{i}'].copy(), i)))
+        return anims
+
+    @profiling.helper
     def animate_set(self, index: int, new_value, source: Mobject = None,
                     resize=False):
+        sources = {} if source is None else {index: source}
+        return self._set_cells({index: new_value}, sources, resize)
+
+    @profiling.helper
+    def animate_set_many(self, new_values: dict, sources: dict = None,
+                         resize=False) -> ([Animation], [Animation]):
+        """Sets several items at once, e.g. {0: 'a', 3: 'b'}. Returns the
+        same two lists of animations as animate_set.
+
+        This lays out the list once no matter how many items change.
+        sources optionally maps indices to a Mobject to move into that cell.
+        """
+        return self._set_cells(new_values, sources or {}, resize)
+
+    def _set_cells(self, new_values: dict, sources: dict, resize: bool):
         assert len(self.contents) > 0, 'Should use append'
-        assert not resize, 'Not implemented yet'
-        new_align = (self, UL)
-        self.contents[index] = new_value
-        new_list = List(self.contents,
-                        horizontal=self.horizontal)
-        new_list.scale_to_fit_width(self.width).align_to(new_align[0], new_align[1])
-
-        target_mobj = new_list[f'index_{index}']
-        old_item = self[f'index_{index}'].copy()
-        if source:
-            source_mobj = self[f'index_{index}']
-            source_mobj.become(source)
-            copy_anims = [
-                Transform(source_mobj, target_mobj),
-                FadeOut(old_item),
-            ]
+        targets = {}
+        sizes = list(self.cell_sizes)
+        for index, new_value in new_values.items():
+            self.contents[index] = new_value
+            targets[index] = cell_fn(cell_text(new_value))
+            sizes[index] = (targets[index].width, targets[index].height)
+        current_scale = self._current_scale()
+        layout = ListLayout(sizes, self.horizontal)
+
+        resize_anims = []
+        if layout.same_lines(ListLayout(self.cell_sizes, self.horizontal)):
+            # Nothing else has to move, so they go right where the old ones were
+            for index, target_mobj in targets.items():
+                target_mobj.scale(current_scale)
+                target_mobj.move_to(VGroup(self[f'div_{index - 1}_{index}'],
+                                           self[f'div_{index}_{index + 1}']).get_center())
+            self.cell_sizes = sizes
+        elif resize:
+            layout.place(current_scale, self, UL)
+            resize_anims = self._relayout_anims(layout, len(self.contents), 1.0,
+                                                skip=targets.keys())
+            for index, target_mobj in targets.items():
+                target_mobj.scale(current_scale).move_to(layout.centers[index])
+            self.cell_sizes = sizes
         else:
-            self[f'index_{index}'].become(target_mobj).set_opacity(0)
-            copy_anims = [
-                self[f'index_{index}'].animate.set_opacity(1),
-                FadeOut(old_item),
-            ]
+            # Squeeze them in where they would go in a list of the new contents
+            # that is as wide as this one. Nothing else moves, so cell_sizes
+            # keeps describing the lines we actually have.
+            scale = self.width / layout.width
+            layout.place(scale, self, UL)
+            for index, target_mobj in targets.items():
+                target_mobj.scale(scale).move_to(layout.centers[index])
 
-        return [], copy_anims
+        copy_anims = []
+        for index, target_mobj in targets.items():
+            copy_anims += replace_cell(self[f'index_{index}'], target_mobj,
+                                       sources.get(index))
+        return resize_anims, copy_anims
 
     def add_background_for_cell(self, index: int, color) -> Mobject:
         back = SurroundingRectangle(VGroup(
@@ -152,9 +214,36 @@ class List(VDict):
         return back
 
 
+def replace_cell(cell: Mobject, target_mobj: Mobject,
+                 source: Optional[Mobject] = None) -> [Animation]:
+    """Turns cell into target_mobj, either by moving source into place or
+    by fading it in, while the old value fades out."""
+    old_item = cell.copy()
+    if source:
+        cell.become(source)
+        return [
+            Transform(cell, target_mobj),
+            FadeOut(old_item),
+        ]
+    cell.become(target_mobj).set_opacity(0)
+    return [
+        cell.animate.set_opacity(1),
+        FadeOut(old_item),
+    ]
+
+
+def cell_text(item) -> str:
+    """The text shown in a list cell for the given item."""
+    if isinstance(item, str):
+        return '"' + item + '"'
+    elif isinstance(item, List):
+        return '<list>'
+    return str(item)
+
+
 def cell_fn(s, **kwargs):
     assert isinstance(s, str), s
-    return Text(s, font_size=18, font=LM_MONO).set_color(BLACK).scale(1.25)
+    return cached_text(s, LM_MONO, 18).set_color(BLACK).scale(1.25)
 
 
 def create_horizontal_list(data):
@@ -162,11 +251,11 @@ def create_horizontal_list(data):
     assert len(data[0]) > 0, data
     data = Table(data,
                  include_outer_lines=True,
-                 line_config={'stroke_width': 2, "color": BLACK},
+                 line_config=LINE_CONFIG,
                  element_to_mobject=cell_fn,
                  include_background_rectangle=True,
                  background_rectangle_color=WHITE,
-                 h_buff=0.3, v_buff=0.2)
+                 h_buff=H_BUFF, v_buff=V_BUFF)
     name_mobj = {
         'background_rect': data[0],
         'top_line': data[2],
@@ -186,11 +275,11 @@ def create_vertical_list(data):
     assert len(data[0]) == 1, data
     data = Table(data,
                  include_outer_lines=True,
-                 line_config={'stroke_width': 2, "color": BLACK},
+                 line_config=LINE_CONFIG,
                  element_to_mobject=cell_fn,
                  include_background_rectangle=True,
                  background_rectangle_color=WHITE,
-                 h_buff=0.3, v_buff=0.2)
+                 h_buff=H_BUFF, v_buff=V_BUFF)
     name_mobj = {
         'background_rect': data[0],
         'top_line': data[2],
@@ -205,13 +294,286 @@ def create_vertical_list(data):
     return name_mobj
 
 
+class ListLayout:
+    """Where the Table from create_horizontal_list or create_vertical_list
+    puts every cell and line, worked out from the cell sizes alone.
+
+    Positions start out at the native scale, centered on the origin (just
+    like a freshly made List). Use place() to scale and align it.
+    """
+
+    def __init__(self, sizes, horizontal=True):
+        self.horizontal = horizontal
+        widths = np.array([size[0] for size in sizes], dtype=float)
+        heights = np.array([size[1] for size in sizes], dtype=float)
+        zeros = np.zeros(len(sizes))
+        if horizontal:
+            cells_width = widths.sum() + H_BUFF * (len(sizes) - 1)
+            cells_height = heights.max()
+            lefts = -cells_width / 2 + np.concatenate(
+                ([0], np.cumsum(widths[:-1] + H_BUFF)))
+            self._centers = np.stack([lefts + widths / 2, zeros, zeros], axis=1)
+            # Dividers go halfway between two cells
+            self._dividers = lefts[1:] - H_BUFF / 2
+        else:
+            cells_width = widths.max()
+            cells_height = heights.sum() + V_BUFF * (len(sizes) - 1)
+            tops = cells_height / 2 - np.concatenate(
+                ([0], np.cumsum(heights[:-1] + V_BUFF)))
+            self._centers = np.stack([zeros, tops - heights / 2, zeros], axis=1)
+            self._dividers = tops[1:] + V_BUFF / 2
+        self.right = (cells_width + H_BUFF) / 2
+        self.left = -self.right
+        self.top = (cells_height + V_BUFF) / 2
+        self.bottom = -self.top
+        self.scale = 1.0
+        self.offset = np.zeros(3)
+
+    def place(self, scale: float, mobject_or_point, direction):
+        """Scales the layout, then aligns it the same way Mobject.align_to would."""
+        self.scale = scale
+        self.offset = np.zeros(3)
+        if isinstance(mobject_or_point, Mobject):
+            point = mobject_or_point.get_critical_point(direction)
+        else:
+            point = mobject_or_point
+        native = [
+            self.right if direction[0] > 0 else self.left,
+            self.top if direction[1] > 0 else self.bottom,
+        ]
+        for dim in range(0, 2):
+            if direction[dim] != 0:
+                self.offset[dim] = point[dim] - scale * native[dim]
+        return self
+
+    def point(self, x: float, y: float):
+        return np.array([x, y, 0.0]) * self.scale + self.offset
+
+    @property
+    def centers(self):
+        """The center of each cell."""
+        return self._centers * self.scale + self.offset
+
+    @property
+    def center(self):
+        return self.offset.copy()
+
+    @property
+    def width(self) -> float:
+        return (self.right - self.left) * self.scale
+
+    @property
+    def height(self) -> float:
+        return (self.top - self.bottom) * self.scale
+
+    def same_lines(self, other: 'ListLayout') -> bool:
+        """True if both layouts have their lines in the same places."""
+        return (np.allclose([self.left, self.right, self.top, self.bottom],
+                            [other.left, other.right, other.top, other.bottom])
+                and np.allclose(self._dividers, other._dividers))
+
+    def fit(self, mobj: Mobject, index: Optional[int] = None) -> Mobject:
+        """Stretches mobj over the whole list, or just the cell at index
+        (like add_background_for_cell does)."""
+        left, right, top, bottom = self.left, self.right, self.top, self.bottom
+        if index is not None:
+            if index > 0:
+                if self.horizontal:
+                    left = self._dividers[index - 1]
+                else:
+                    top = self._dividers[index - 1]
+            if index < len(self._dividers):
+                if self.horizontal:
+                    right = self._dividers[index]
+                else:
+                    bottom = self._dividers[index]
+        mobj.stretch_to_fit_width((right - left) * self.scale)
+        mobj.stretch_to_fit_height((top - bottom) * self.scale)
+        return mobj.move_to(self.point((left + right) / 2, (top + bottom) / 2))
+
+    def line(self, key: str) -> Line:
+        """One of top_line, bottom_line, left_line or right_line."""
+        if key == 'top_line':
+            start, end = (self.left, self.top), (self.right, self.top)
+        elif key == 'bottom_line':
+            start, end = (self.left, self.bottom), (self.right, self.bottom)
+        elif key == 'left_line':
+            start, end = (self.left, self.top), (self.left, self.bottom)
+        elif key == 'right_line':
+            start, end = (self.right, self.top), (self.right, self.bottom)
+        else:
+            assert False, key
+        return Line(self.point(*start), self.point(*end), **LINE_CONFIG)
+
+    def divider(self, index: int) -> Line:
+        """The line between the cells at index - 1 and index."""
+        pos = self._dividers[index - 1]
+        if self.horizontal:
+            start, end = (pos, self.top), (pos, self.bottom)
+        else:
+            start, end = (self.left, pos), (self.right, pos)
+        return Line(self.point(*start), self.point(*end), **LINE_CONFIG)
+
+
+class Grid(VDict):
+    """A 2-D table of values (e.g. a list of lists), built in one go.
+
+    Unlike a List of Lists, cells are found by (row, col) and all the
+    positions are kept in arrays, so nothing has to be looked up by name or
+    rebuilt to find where a cell is.
+    """
+
+    def __init__(self, contents: [list]):
+        super().__init__()
+        assert len(contents) > 0 and len(contents[0]) > 0, contents
+        assert all(len(row) == len(contents[0]) for row in contents), contents
+        self.contents = [list(row) for row in contents]
+        self.num_rows = len(contents)
+        self.num_cols = len(contents[0])
+
+        cells = VGroup(*[VGroup(*[cell_fn(cell_text(item)) for item in row])
+                         for row in contents])
+        # (row, col, [width, height]) at the native scale
+        self.cell_sizes = np.array([[[cell.width, cell.height] for cell in row]
+                                    for row in cells])
+        col_widths = self.cell_sizes[:, :, 0].max(axis=0)
+        row_heights = self.cell_sizes[:, :, 1].max(axis=1)
+
+        # Like Table, lines go halfway between the cells and half a buffer
+        # outside of them. x grows to the right, y grows up.
+        self._col_lines = np.concatenate(
+            ([0], np.cumsum(col_widths + H_BUFF))) - H_BUFF / 2
+        self._row_lines = -(np.concatenate(
+            ([0], np.cumsum(row_heights + V_BUFF))) - V_BUFF / 2)
+        self._centers = np.zeros((self.num_rows, self.num_cols, 3))
+        self._centers[:, :, 0] = (self._col_lines[:-1] + self._col_lines[1:])[None, :] / 2
+        self._centers[:, :, 1] = (self._row_lines[:-1] + self._row_lines[1:])[:, None] / 2
+        for r in range(0, self.num_rows):
+            for c in range(0, self.num_cols):
+                cells[r][c].move_to(self._centers[r, c])
+
+        left, right = self._col_lines[0], self._col_lines[-1]
+        top, bottom = self._row_lines[0], self._row_lines[-1]
+        row_lines = VGroup(*[Line([left, y, 0], [right, y, 0], **LINE_CONFIG)
+                             for y in self._row_lines])
+        col_lines = VGroup(*[Line([x, top, 0], [x, bottom, 0], **LINE_CONFIG)
+                             for x in self._col_lines])
+        background = Rectangle(width=right - left, height=top - bottom,
+                               stroke_width=0, fill_color=WHITE,
+                               fill_opacity=1.0)
+        background.move_to([(left + right) / 2, (top + bottom) / 2, 0])
+        self.add([
+            ('background_rect', background),
+            ('backs', VGroup()),
+            ('cells', cells),
+            ('row_lines', row_lines),
+            ('col_lines', col_lines),
+        ])
+        # Start centered on the origin, like a List does.
+        self.move_to(ORIGIN)
+
+    def _scale(self) -> float:
+        native = self._col_lines[-1] - self._col_lines[0]
+        return self['row_lines'][0].get_length() / native
+
+    def _to_scene(self, native_points):
+        """Converts points from the native layout to where they are now."""
+        scale = self._scale()
+        native_start = np.array([self._col_lines[0], self._row_lines[0], 0])
+        return (self['row_lines'][0].get_start()
+                + (np.asarray(native_points) - native_start) * scale)
+
+    def cell(self, row: int, col: int) -> Mobject:
+        return self['cells'][row][col]
+
+    def centers(self):
+        """The center of every cell, indexed by [row, col]."""
+        return self._to_scene(self._centers)
+
+    def center_of(self, row: int, col: int):
+        return self._to_scene(self._centers[row, col])
+
+    def bounds(self, row: int, col: int, rows=1, cols=1):
+        """The (UL, DR) corners of a block of cells, lines included."""
+        ul = [self._col_lines[col], self._row_lines[row], 0]
+        dr = [self._col_lines[col + cols], self._row_lines[row + rows], 0]
+        return self._to_scene(ul), self._to_scene(dr)
+
+    def window(self, row: int, col: int, rows=1, cols=1, buff=0.05,
+               **kwargs) -> Rectangle:
+        """A rectangle around a block of cells, e.g. a sliding window.
+
+        kwargs go to the Rectangle (color, stroke_width, etc).
+        """
+        ul, dr = self.bounds(row, col, rows, cols)
+        rect = Rectangle(width=dr[0] - ul[0] + 2 * buff,
+                         height=ul[1] - dr[1] + 2 * buff, **kwargs)
+        return rect.move_to((ul + dr) / 2)
+
+    def window_center(self, row: int, col: int, rows=1, cols=1):
+        """Where to move_to a window so it covers a different block."""
+        ul, dr = self.bounds(row, col, rows, cols)
+        return (ul + dr) / 2
+
+    def add_background(self, row: int, col: int, color,
+                       rows=1, cols=1) -> Mobject:
+        """Colors in a block of cells, behind the values."""
+        back = self.window(row, col, rows, cols, buff=0, stroke_width=0,
+                           fill_color=color, fill_opacity=1.0)
+        self['backs'].add(back)
+        return back
+
+    def add_background_for_cell(self, row: int, col: int, color) -> Mobject:
+        return self.add_background(row, col, color)
+
+    def add_background_for_row(self, row: int, color) -> Mobject:
+        return self.add_background(row, 0, color, cols=self.num_cols)
+
+    def add_background_for_column(self, col: int, color) -> Mobject:
+        return self.add_background(0, col, color, rows=self.num_rows)
+
+    @profiling.helper
+    def animate_set(self, row: int, col: int, new_value,
+                    source: Mobject = None):
+        """Like List.animate_set, the rows and columns do not change size.
+        Values too big for their cell are shrunk to fit."""
+        sources = {} if source is None else {(row, col): source}
+        return [], self._set_cells({(row, col): new_value}, sources)
+
+    @profiling.helper
+    def animate_set_many(self, new_values: dict,
+                         sources: dict = None) -> ([Animation], [Animation]):
+        """Sets several cells at once, e.g. {(5, 2): 'G', (5, 4): 'B'}.
+        Returns the same two lists of animations as animate_set."""
+        return [], self._set_cells(new_values, sources or {})
+
+    def _set_cells(self, new_values: dict, sources: dict) -> [Animation]:
+        scale = self._scale()
+        centers = self.centers()
+        col_widths = self.cell_sizes[:, :, 0].max(axis=0)
+        row_heights = self.cell_sizes[:, :, 1].max(axis=1)
+        copy_anims = []
+        for (row, col), new_value in new_values.items():
+            self.contents[row][col] = new_value
+            target_mobj = cell_fn(cell_text(new_value))
+            shrink = min(1.0, col_widths[col] / target_mobj.width,
+                         row_heights[row] / target_mobj.height)
+            target_mobj.scale(shrink * scale).move_to(centers[row, col])
+            copy_anims += replace_cell(self.cell(row, col), target_mobj,
+                                       sources.get((row, col)))
+        return copy_anims
+
+
 # TODO This would probably be more convenient if it
 # also included the <list> or <dictionary> part also
 class Pointer(VDict):
+    # How far the line stops short of start and end
+    buff = 0.03
+
     def __init__(self, start, end, tip_size=0.25, stroke_width=5):
         super().__init__()
         line = Line(start=start, end=end, stroke_width=stroke_width,
-                    stroke_color=BLACK, buff=0.03)
+                    stroke_color=BLACK, buff=self.buff)
         tip = _ArrowTriangleTip(stroke_width=0, fill_opacity=1.0,
                                 length=tip_size, width=tip_size,
                                 stroke_color=BLACK, fill_color=BLACK)
@@ -224,29 +586,17 @@ class Pointer(VDict):
         self.add([('line', line), ('tip', tip)])
 
     def point_to(self, end) -> Animation:
-        new_pointer = Pointer(start=self.start,
-                              end=end,
-                              tip_size=self.tip_size,
-                              stroke_width=self.stroke_width)
-        self.end = end
-        return Transform(self, new_pointer)
+        return self.relocate(self.start, end)
 
     def point_from(self, start) -> Animation:
-        new_pointer = Pointer(start=start,
-                              end=self.end,
-                              tip_size=self.tip_size,
-                              stroke_width=self.stroke_width)
-        self.start = start
-        return Transform(self, new_pointer)
+        return self.relocate(start, self.end)
 
+    @profiling.helper
     def relocate(self, start, end) -> Animation:
-        new_pointer = Pointer(start=start,
-                              end=end,
-                              tip_size=self.tip_size,
-                              stroke_width=self.stroke_width)
+        anim = PointerMove(self, start, end)
         self.start = start
         self.end = end
-        return Transform(self, new_pointer)
+        return anim
 
 
 # not exported from Manim proper, probably by mistake
@@ -8,14 +8,28 @@ from .functions import Function
 from .utils import surround
 from .variables import VariableBox, code_value
 
+# Ranges with more items than this are shown as [0, 1, 2, …, 98, 99]
+MAX_SHOWN_ITEMS = 12
+ELLIPSIS = '…'
+
 class ForRange:
-    def __init__(self, loop_var: VariableBox, range_code: VGroup):
+    def __init__(self, loop_var: VariableBox, range_code: VGroup,
+                 max_shown: int = MAX_SHOWN_ITEMS, shown_at_end: int = 2):
         self.loop_var = loop_var
         self.range_code = range_code
         self.code_tracker = None
         self.expanded_range = None
-        self.range = []
+        self.range = range(0)
         self.index = -1
+        # At least one item before the ellipsis, and none or more after it
+        assert shown_at_end >= 0, shown_at_end
+        assert max_shown - shown_at_end - 1 >= 1, (max_shown, shown_at_end)
+        self.max_shown = max_shown
+        self.shown_at_end = shown_at_end
+        # (offset, length) of each item (or the ellipsis) in expanded_range
+        self.slots = []
+        # How many items are shown before the ellipsis
+        self.shown_at_start = 0
 
 
     def expand_range(self, scene: Scene, range_fn: Function,
@@ -110,36 +124,85 @@ class ForRange:
         )
 
     def _make_range_and_targets(self, start: int, stop: int, step: int):
-        self.range = list(range(start, stop, step))
-        range_txt = code_value(str(self.range))
+        self.range = range(start, stop, step)
+        if len(self.range) > self.max_shown:
+            self.shown_at_start = self.max_shown - self.shown_at_end - 1
+            items = ([str(i) for i in self.range[:self.shown_at_start]]
+                     + [ELLIPSIS]
+                     + [str(i) for i in self.range[len(self.range) - self.shown_at_end:]])
+        else:
+            self.shown_at_start = len(self.range)
+            items = [str(i) for i in self.range]
+        # Same as str(list(...)) when nothing is left out
+        range_txt = code_value('[' + ', '.join(items) + ']')
 
-        targets = []
+        self.slots = []
         offset = 1
-        for i in range(0, len(self.range)):
-            new_len = len(str(self.range[i]))
-            target = range_txt[offset:offset+new_len]
+        for i, item in enumerate(items):
+            new_len = len(item)
             # Make the spaces less wide. How much? The width of
             # the opening square brace, which looks less wide than
-            # the space.
-            target.shift(LEFT * range_txt[0].width * i)
-            # Also move commas and closing square brace
-            range_txt[offset+new_len].shift(LEFT * range_txt[0].width * i)
-            targets.append(target)
+            # the space. This also moves the comma (or closing
+            # square brace) after it.
+            range_txt[offset:offset+new_len+1].shift(LEFT * range_txt[0].width * i)
+            self.slots.append((offset, new_len))
             offset += new_len
             offset += 1 # and the comma
-        self.targets = targets
         self.expanded_range = range_txt
 
+    def _slot(self, index: int) -> Optional[int]:
+        """Which of self.slots shows range[index], or None if it is one of
+        the items left out."""
+        if index < self.shown_at_start:
+            return index
+        from_end = len(self.range) - index
+        if len(self.slots) == len(self.range) or from_end <= self.shown_at_end:
+            return len(self.slots) - from_end
+        return None
+
+    def target(self, index: int) -> Mobject:
+        """The part of the expanded range showing range[index]. Items that
+        are left out get a stand-in on top of the ellipsis."""
+        slot = self._slot(index)
+        if slot is not None:
+            offset, length = self.slots[slot]
+            return self.expanded_range[offset:offset+length]
+        offset, length = self.slots[self.shown_at_start]
+        ellipsis = self.expanded_range[offset:offset+length]
+        stand_in = code_value(str(self.range[index]))
+        # The first item is always shown, unlike the last
+        first_offset, first_length = self.slots[0]
+        stand_in.scale_to_fit_height(
+            self.expanded_range[first_offset:first_offset+first_length].height)
+        return stand_in.move_to(ellipsis)
+
+    def _tracked(self, index: int) -> Mobject:
+        """What the code tracker surrounds for range[index]."""
+        slot = self._slot(index)
+        if slot is None:
+            slot = self.shown_at_start
+        offset, length = self.slots[slot]
+        return self.expanded_range[offset:offset+length]
 
     def go_next(self, scene: Scene, wait=0.1):
         self.index += 1
-        next_target = self.targets[self.index]
-        scene.play(surround(self.code_tracker, next_target))
+        scene.play(surround(self.code_tracker, self._tracked(self.index)))
         scene.wait(wait)
 
         scene.play(*self.loop_var.update_contents(self.range[self.index],
-                                                  next_target))
-
+                                                  self.target(self.index)))
+
+    def skip_iterations(self, scene: Scene, n: int, wait=0.1):
+        """Moves the loop on by n iterations in a single animation, instead
+        of n calls to go_next."""
+        assert n > 0
+        self.index += n
+        assert self.index < len(self.range), \
+            f'Only {len(self.range)} iterations in {self.range}'
+        scene.play(surround(self.code_tracker, self._tracked(self.index)),
+                   *self.loop_var.update_contents(self.range[self.index],
+                                                  self.target(self.index)))
+        scene.wait(wait)
 
     def finish(self, scene: Scene, skip_highlight = False):
         range_box = self.code_tracker
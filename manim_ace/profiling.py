@@ -0,0 +1,231 @@
+"""Where the time goes in an AnimatedCodeScene.
+
+Set AnimatedCodeScene.profile (or $MANIM_ACE_PROFILE) to a .json file and
+every play and wait is timed, split into:
+
+- build: the scene's own code since the last play, plus manim compiling
+  and starting the animations,
+- interpolate: moving mobjects for each frame,
+- render: drawing and writing frames,
+- other: the rest of manim's play (hashing, partial movie files, ...).
+
+Each is tagged with the manim_ace helper that played it (e.g.
+AnimatedCodeScene.create_variable), or for plays in construct, the helpers
+that made the animations (e.g. move_pc). The file loads in chrome://tracing
+or https://ui.perfetto.dev, and a .folded file of stacks next to it works
+with flamegraph.pl or speedscope.
+"""
+import functools
+import json
+import os
+import sys
+import time
+
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+import manim
+
+from manim import logger
+
+PHASES = ['build', 'interpolate', 'render', 'other']
+
+_MANIM_ACE_DIR = os.path.dirname(os.path.abspath(__file__))
+_MANIM_DIR = os.path.dirname(os.path.abspath(manim.__file__))
+_STDLIB_DIR = os.path.dirname(os.path.abspath(os.__file__))
+# Frames that are only in the way between a helper and the renderer
+_WRAPPERS = {'play', 'wait', 'pause', 'call', '__enter__', 'helper_wrapper'}
+
+# The profiler of the scene being rendered, if it is being profiled
+_active = None
+
+
+def helper(fn):
+    """Marks a function that makes animations for someone else to play, so
+    those plays can be tagged with it."""
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def helper_wrapper(*args, **kwargs):
+        if _active is not None:
+            _active.note(name)
+        return fn(*args, **kwargs)
+    return helper_wrapper
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    # co_qualname is only in Python 3.11+
+    return getattr(code, 'co_qualname', code.co_name)
+
+
+def _stack() -> [tuple]:
+    """(where, name) of the functions (outermost first) that called play,
+    leaving out manim and the wrappers around play."""
+    names = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(_MANIM_DIR):
+            if frame.f_code.co_name == 'render':
+                break
+        elif filename.startswith(_STDLIB_DIR):
+            pass
+        elif filename.startswith(_MANIM_ACE_DIR):
+            if frame.f_code.co_name not in _WRAPPERS:
+                names.append(('manim_ace', _frame_name(frame)))
+        else:
+            names.append(('user', _frame_name(frame)))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+class SceneProfiler:
+
+    def __init__(self, scene, path: str):
+        self.scene = scene
+        self.path = path
+        # One dict per play or wait
+        self.calls = []
+        self.notes = []
+        self.depth = 0
+        self.phases = None
+        self.origin = time.perf_counter()
+        self.last_end = self.origin
+
+        self._wrap(scene, 'compile_animation_data', 'build')
+        self._wrap(scene, 'begin_animations', 'build')
+        self._wrap(scene, 'update_to_time', 'interpolate')
+        for name in ['render', 'save_static_frame_data', 'freeze_current_frame']:
+            self._wrap(scene.renderer, name, 'render')
+
+    def _wrap(self, obj, name: str, phase: str):
+        method = getattr(obj, name, None)
+        if method is None:
+            return
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            if self.phases is None:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.phases[phase] += time.perf_counter() - start
+        setattr(obj, name, timed)
+
+    def note(self, name: str):
+        self.notes.append(name)
+
+    @contextmanager
+    def call(self, kind: str):
+        self.depth += 1
+        if self.depth > 1:
+            # wait and pause play too, they are timed by the outer call
+            try:
+                yield
+            finally:
+                self.depth -= 1
+            return
+
+        stack = _stack()
+        notes = list(dict.fromkeys(self.notes))
+        self.notes = []
+        helpers = [name for where, name in stack if where == 'manim_ace']
+        if helpers:
+            tag = helpers[-1]
+        elif notes:
+            tag = '+'.join(notes)
+            stack.append(('notes', tag))
+        else:
+            tag = stack[-1][1] if stack else kind
+
+        start = time.perf_counter()
+        self.phases = defaultdict(float)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            timed = sum(self.phases.values())
+            self.phases['other'] = max(0.0, end - start - timed)
+            # The scene's code since the last call built this one
+            self.phases['build'] += start - self.last_end
+            self.calls.append({
+                'kind': kind,
+                'tag': tag,
+                'stack': [name for _, name in stack],
+                'start': self.last_end - self.origin,
+                'end': end - self.origin,
+                'phases': {phase: self.phases[phase] for phase in PHASES},
+            })
+            self.phases = None
+            self.last_end = end
+            self.depth -= 1
+
+    def chrome_trace(self) -> dict:
+        events = []
+        for call in self.calls:
+            ts = call['start'] * 1e6
+            events.append({
+                'name': call['tag'], 'cat': call['kind'], 'ph': 'X',
+                'ts': ts, 'dur': (call['end'] - call['start']) * 1e6,
+                'pid': 0, 'tid': 0,
+                'args': {'stack': ';'.join(call['stack']), **call['phases']},
+            })
+            # The phases are spread over the whole call, but are shown one
+            # after the other so they stack under it.
+            for phase in PHASES:
+                dur = call['phases'][phase] * 1e6
+                if dur > 0:
+                    events.append({'name': phase, 'cat': phase, 'ph': 'X',
+                                   'ts': ts, 'dur': dur, 'pid': 0, 'tid': 0})
+                    ts += dur
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def folded_stacks(self) -> [str]:
+        totals = defaultdict(float)
+        for call in self.calls:
+            stack = ';'.join(call['stack'] + [call['kind']])
+            for phase in PHASES:
+                totals[f'{stack};{phase}'] += call['phases'][phase]
+        return [f'{stack} {round(seconds * 1e6)}'
+                for stack, seconds in sorted(totals.items()) if seconds > 0]
+
+    def summary(self, top: int = 10) -> str:
+        by_tag = defaultdict(lambda: defaultdict(float))
+        for call in self.calls:
+            for phase in PHASES:
+                by_tag[call['tag']][phase] += call['phases'][phase]
+            by_tag[call['tag']]['calls'] += 1
+        rows = sorted(by_tag.items(),
+                      key=lambda item: -sum(item[1][p] for p in PHASES))
+        lines = [f"{'helper':40} {'calls':>6} " + ' '.join(f'{p:>11}' for p in PHASES)]
+        for tag, totals in rows[:top]:
+            lines.append(f"{tag[:40]:40} {int(totals['calls']):6} "
+                         + ' '.join(f'{totals[p]:10.2f}s' for p in PHASES))
+        return '\n'.join(lines)
+
+    def write(self):
+        path = Path(self.path)
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        with open(path.with_suffix('.folded'), 'w') as f:
+            f.write('\n'.join(self.folded_stacks()) + '\n')
+        logger.info(f'Profile of {type(self.scene).__name__} written to {path}\n'
+                    + self.summary())
+
+
+def start(scene, path: str) -> SceneProfiler:
+    global _active
+    _active = SceneProfiler(scene, path)
+    return _active
+
+
+def stop(profiler: SceneProfiler):
+    global _active
+    if _active is profiler:
+        _active = None
+    profiler.write()
@@ -0,0 +1,293 @@
+"""Renders every AnimatedCodeScene in a file at once, then joins the videos.
+
+    python -m manim_ace.render connect_four.py
+    python -m manim_ace.render connect_four.py ConnectFourIntro BoardScene -q h
+    python -m manim_ace.render connect_four.py -j 2 --output full.mp4
+    python -m manim_ace.render connect_four.py AddTokenScene --split-sections
+
+Each scene renders in its own process, at most --jobs at a time, so one
+scene failing (or crashing) does not stop the others. Scenes are joined in
+the order they are given, or the order they are in the file.
+
+With --split-sections, long scenes are also split at their next_section
+calls. Every process runs the whole construct, but skips the animations of
+the sections it is not rendering, so it reaches its own sections with the
+same mobjects and camera as a normal render would. The parts are then
+joined into the scene's video.
+"""
+import argparse
+import importlib.util
+import inspect
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Optional
+
+QUALITIES = {
+    'l': 'low_quality',
+    'm': 'medium_quality',
+    'h': 'high_quality',
+    'p': 'production_quality',
+    'k': 'fourk_quality',
+}
+
+
+@dataclass
+class Job:
+    # What to call it in the output
+    name: str
+    scene: str
+    # Which sections to render, or None for all of them
+    sections: Optional[range] = None
+
+
+@dataclass
+class SceneResult:
+    name: str
+    ok: bool
+    seconds: float
+    movie: Optional[str] = None
+    error: Optional[str] = None
+
+
+def load_module(path: str):
+    """Imports a file of scenes, with its directory on sys.path like manim."""
+    path = Path(path).resolve()
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scenes(module) -> [str]:
+    """Names of the AnimatedCodeScenes defined in module, in file order."""
+    from .scene import AnimatedCodeScene
+
+    scenes = []
+    for name, value in vars(module).items():
+        if (inspect.isclass(value) and issubclass(value, AnimatedCodeScene)
+                and value.__module__ == module.__name__):
+            scenes.append((inspect.getsourcelines(value)[1], name))
+    return [name for _, name in sorted(scenes)]
+
+
+def render_scene(path: str, job: Job, config_overrides: dict) -> SceneResult:
+    """Renders (part of) one scene in this process."""
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    try:
+        module = load_module(path)
+        scene_class = getattr(module, job.scene)
+        scene_class.sections_to_render = job.sections
+        overrides = dict(config_overrides)
+        if job.sections is not None:
+            # Keep the parts apart. manim names the partial movie directory
+            # after the scene, not output_file, so that needs moving too.
+            part_name = (f'{job.scene}_sections_'
+                         f'{job.sections.start}_{job.sections.stop - 1}')
+            overrides['output_file'] = part_name
+            overrides['partial_movie_dir'] = ('{video_dir}/partial_movie_files/'
+                                              + part_name)
+        with tempconfig(overrides):
+            scene = scene_class()
+            scene.render()
+            movie = scene.renderer.file_writer.movie_file_path
+        if movie and not os.path.exists(movie):
+            # Nothing in these sections needed rendering
+            movie = None
+        return SceneResult(job.name, True, time.perf_counter() - start,
+                           movie=str(movie) if movie else None)
+    except Exception:
+        return SceneResult(job.name, False, time.perf_counter() - start,
+                           error=traceback.format_exc())
+
+
+def count_section_plays(path: str, scene: str) -> [int]:
+    """Runs a scene without drawing anything to see how many plays each of
+    its sections has."""
+    from manim import tempconfig
+
+    scene_class = getattr(load_module(path), scene)
+    scene_class.sections_to_render = None
+    with tempconfig({'dry_run': True, 'disable_caching': True,
+                     'verbosity': 'ERROR'}):
+        instance = scene_class(skip_animations=True)
+        instance.render()
+    return instance.section_plays()
+
+
+def split_sections(plays: [int], parts: int) -> [range]:
+    """Splits sections into up to parts runs of sections next to each other,
+    each with about the same number of plays."""
+    parts = max(1, min(parts, len(plays)))
+    target = sum(plays) / parts
+    ranges = []
+    start = 0
+    total = 0
+    for i, count in enumerate(plays):
+        total += count
+        left = len(plays) - i - 1
+        # Close this part once it is big enough, or if every later section
+        # is needed to fill the parts still to come
+        if i + 1 < len(plays) and len(ranges) < parts - 1 and (
+                total >= target * (len(ranges) + 1) or left == parts - len(ranges) - 1):
+            ranges.append(range(start, i + 1))
+            start = i + 1
+    ranges.append(range(start, len(plays)))
+    return ranges
+
+
+def _worker(conn, path: str, job: Job, config_overrides: dict):
+    conn.send(render_scene(path, job, config_overrides))
+    conn.close()
+
+
+def render_all(path: str, jobs: [Job], processes: int,
+               config_overrides: dict) -> [SceneResult]:
+    """Runs each job in a fresh process, processes at a time. Results are
+    in the same order as jobs."""
+    context = multiprocessing.get_context('spawn')
+    waiting = list(jobs)
+    running = {}
+    results = {}
+    while waiting or running:
+        while waiting and len(running) < processes:
+            job = waiting.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(target=_worker,
+                                      args=(sender, path, job, config_overrides))
+            process.start()
+            sender.close()
+            running[receiver] = (job.name, process, time.perf_counter())
+            print(f'started  {job.name}', flush=True)
+
+        for receiver in wait(list(running)):
+            name, process, started = running.pop(receiver)
+            try:
+                result = receiver.recv()
+            except EOFError:
+                # The process died without sending anything back
+                process.join()
+                result = SceneResult(name, False, time.perf_counter() - started,
+                                     error=f'worker exited with code {process.exitcode}')
+            process.join()
+            results[name] = result
+            status = 'finished' if result.ok else 'FAILED  '
+            print(f'{status} {name} in {result.seconds:.1f}s', flush=True)
+    return [results[job.name] for job in jobs]
+
+
+def join_parts(scene: str, parts: [SceneResult], ffmpeg: str) -> SceneResult:
+    """Joins the results of rendering parts of a scene into one."""
+    seconds = sum(r.seconds for r in parts)
+    failed = [r for r in parts if not r.ok]
+    if failed:
+        return SceneResult(scene, False, seconds,
+                           error='\n'.join(f'{r.name}:\n{r.error}' for r in failed))
+    movies = [r.movie for r in parts if r.movie]
+    if not movies:
+        return SceneResult(scene, True, seconds)
+    movie = str(Path(movies[0]).with_name(scene + Path(movies[0]).suffix))
+    concatenate(movies, movie, ffmpeg)
+    return SceneResult(scene, True, seconds, movie=movie)
+
+
+def concatenate(movies: [str], output: str, ffmpeg: str = 'ffmpeg'):
+    """Joins videos (all rendered with the same settings) without
+    re-encoding them."""
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for movie in movies:
+            escaped = str(Path(movie).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+        list_file = f.name
+    try:
+        subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-f', 'concat',
+                        '-safe', '0', '-i', list_file, '-c', 'copy', output],
+                       check=True)
+    finally:
+        os.remove(list_file)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('file', help='python file with the scenes')
+    parser.add_argument('scenes', nargs='*',
+                        help='scenes to render (default: every AnimatedCodeScene)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='scenes to render at once (default: number of cores)')
+    parser.add_argument('-q', '--quality', default='l', choices=QUALITIES.keys())
+    parser.add_argument('-o', '--output',
+                        help='joined video (default: <file>_all.mp4 next to the scenes)')
+    parser.add_argument('--no-concat', action='store_true',
+                        help='only render the scenes')
+    parser.add_argument('--split-sections', action='store_true',
+                        help='also render the sections of each scene in parallel')
+    args = parser.parse_args(argv)
+
+    names = args.scenes or find_scenes(load_module(args.file))
+    if not names:
+        print(f'No AnimatedCodeScenes in {args.file}')
+        return 1
+
+    from manim import config
+    ffmpeg = config.ffmpeg_executable or 'ffmpeg'
+
+    start = time.perf_counter()
+    jobs = []
+    for name in names:
+        if not args.split_sections:
+            jobs.append(Job(name, name))
+            continue
+        plays = count_section_plays(args.file, name)
+        for sections in split_sections(plays, args.jobs):
+            if len(sections) == len(plays):
+                jobs.append(Job(name, name))
+            else:
+                jobs.append(Job(f'{name}[{sections.start}-{sections.stop - 1}]',
+                                name, sections))
+    job_results = render_all(args.file, jobs, max(1, args.jobs),
+                             {'quality': QUALITIES[args.quality]})
+
+    results = []
+    for name in names:
+        parts = [r for job, r in zip(jobs, job_results) if job.scene == name]
+        if len(parts) == 1:
+            results.append(parts[0])
+        else:
+            results.append(join_parts(name, parts, ffmpeg))
+    wall_time = time.perf_counter() - start
+
+    print()
+    for result in job_results:
+        status = 'ok' if result.ok else 'FAILED'
+        print(f'{result.name:30} {status:8} {result.seconds:8.1f}s')
+    print(f'{len(names)} scenes in {wall_time:.1f}s '
+          f'({sum(r.seconds for r in job_results):.1f}s of rendering)')
+
+    failed = [r for r in results if not r.ok]
+    for result in failed:
+        print(f'\n{result.name} failed:\n{result.error}', file=sys.stderr)
+
+    movies = [r.movie for r in results if r.ok and r.movie]
+    if movies and not args.no_concat:
+        output = args.output or str(Path(movies[0]).parent / f'{Path(args.file).stem}_all.mp4')
+        concatenate(movies, output, ffmpeg)
+        print(f'Joined {len(movies)} scenes into {output}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
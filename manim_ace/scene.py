@@ -1,15 +1,23 @@
 from manim import *
 import numpy as np
 
-import manimpango
+import os
+import weakref
 
-from typing import Optional
+from typing import NamedTuple, Optional
 
-from .fonts import LM_MONO, ROBOTO_MONO
+from .animations import FadeOpacity, fade_opacity
+from .checkpoints import checkpoint_key, load_checkpoint, save_checkpoint
+from .fonts import LM_MONO, ROBOTO_MONO, resolve_font
 from .colors import (IBM_RED_60, BLACK_07, IBM_CYAN_20, IBM_RED_20, IBM_CYAN_60,
                      STANDARD_FUNCTION_COLOR, LIBRARY_FUNCTION_COLOR,
                      SECONDARY_RECT_COLOR)
-from .code import CodeWindow
+from . import profiling
+from .code import CodeWindow, ScrollingCodeWindow
+from .dirty_regions import DirtyRegions
+from .frame_cache import StaticFrameCache, keep_static
+from .holds import StaticHolds, holds_supported
+from .streaming import StreamingWriter
 from .lists import Pointer
 from .utils import surround
 from .variables import VariableArea, VariableBox, code_value
@@ -21,7 +29,68 @@ TRUE_BACKGROUND_COLOR = IBM_CYAN_20
 FALSE_BACKGROUND_COLOR = IBM_RED_20
 
 
+class LayerStats(NamedTuple):
+    name: str
+    # Everything in the layer, at any depth, not counting the layer
+    mobjects: int
+    points: int
+    # Of the points and colors, which is most of a mobject
+    bytes: int
+    # How many of mobjects were redrawn on every frame of the last play
+    moving: int
+
+
+def _array_bytes(mobj: Mobject) -> int:
+    total = mobj.points.nbytes
+    for attr in ('fill_rgbas', 'stroke_rgbas', 'background_stroke_rgbas'):
+        array = getattr(mobj, attr, None)
+        if array is not None:
+            total += array.nbytes
+    return total
+
+
 class AnimatedCodeScene(MovingCameraScene):
+    # Set to True to double check every remove() against a full search of
+    # the scene, which is what the parent index is meant to avoid.
+    check_remove_index = False
+    # Indices of the sections to render (0 is everything before the first
+    # next_section). The others are run with skip_animations, which keeps
+    # the scene state right without drawing any frames. manim_ace.render
+    # uses this to split one scene across processes. None renders them all.
+    sections_to_render: Optional[range] = None
+    # Set to False to always run the body of a checkpointed_section
+    use_checkpoints = True
+    # The attributes a checkpointed_section saves and restores (along with
+    # the camera frame). Scenes that keep state of their own across
+    # sections add its names here.
+    checkpoint_state = ('mobjects', 'layers', 'pc', 'pc_loc', 'pc_stack',
+                        'code_window', 'variables', 'functions')
+    # Set to a .json file (or set $MANIM_ACE_PROFILE) to time every play and
+    # wait. See profiling.py.
+    profile: Optional[str] = None
+    # Log layer_stats() every this many plays (and waits), if not 0
+    log_layer_stats_every = 0
+    # Reuse the picture of everything that is not moving from one play to
+    # the next, see StaticFrameCache
+    cache_static_frames = False
+    # Indices of the layers that are drawn once per play, under everything
+    # that moves, unless they are animated themselves. mark_static does the
+    # same for single mobjects. See keep_static.
+    static_layers: tuple = ()
+    # Redraw only the part of each frame that is animated, see DirtyRegions.
+    # check_dirty_regions also draws every frame whole to compare, which is
+    # slower than not using it at all.
+    render_dirty_regions = False
+    check_dirty_regions = False
+    # Send each still wait and pause to ffmpeg as a single frame, see
+    # StaticHolds
+    dedupe_holds = False
+    # Write the whole movie through one ffmpeg, with a chapter per section,
+    # instead of a partial movie file per play. See StreamingWriter.
+    stream_movie = False
+    # The x264 preset stream_movie encodes with
+    stream_preset: Optional[str] = 'veryfast'
+
     # It is not recommended to override the __init__ method in user Scenes.
     # For code that should be ran before a Scene is rendered, use Scene.setup() instead
     def setup(self):
@@ -38,25 +107,242 @@ class AnimatedCodeScene(MovingCameraScene):
             Group(name="Layer 2"),
             Group(name="Layer 3 (pc)"),
         ]
+        # Where each mobject was last seen, so remove() does not have to
+        # search the whole scene. Entries are checked before they are used.
+        self._parents = weakref.WeakKeyDictionary()
+        self._at_root = weakref.WeakSet()
+        # Mobjects drawn as part of the still picture, see mark_static
+        self._marked_static = weakref.WeakSet()
+        # renderer.num_plays when each section started
+        self.section_starts = [0]
+        self._checkpoint_key = ''
+        if not self._renders_section(0):
+            self.renderer.file_writer.sections[0].skip_animations = True
+
+        self.streaming_writer = None
+        if (self.stream_movie and write_to_movie() and not is_gif_format()
+                and isinstance(getattr(self.renderer, 'camera', None), Camera)
+                and hasattr(self.renderer.file_writer, 'movie_file_path')):
+            self.streaming_writer = StreamingWriter(self, preset=self.stream_preset)
+
+        self.static_frame_cache = None
+        if self.cache_static_frames and hasattr(self.renderer, 'save_static_frame_data'):
+            self.static_frame_cache = StaticFrameCache(self.renderer)
+
+        self.dirty_regions = None
+        if self.render_dirty_regions and isinstance(getattr(self.renderer, 'camera', None), Camera):
+            self.dirty_regions = DirtyRegions(self, check=self.check_dirty_regions)
+
+        self.static_holds = None
+        # A stream writes every frame itself
+        if (self.dedupe_holds and self.streaming_writer is None
+                and hasattr(self.renderer, 'freeze_current_frame')):
+            if holds_supported():
+                self.static_holds = StaticHolds(self)
+            else:
+                logger.warning('dedupe_holds needs manim to pipe frames to ffmpeg, '
+                               'which this version does not')
 
-        fonts = manimpango.list_fonts()
-        # print(fonts)
-        assert (LM_MONO in fonts)
-        assert (ROBOTO_MONO in fonts)
+        self.profiler = None
+        profile = self.profile or os.environ.get('MANIM_ACE_PROFILE')
+        if profile:
+            self.profiler = profiling.start(self, profile)
+
+        for font in (LM_MONO, ROBOTO_MONO):
+            if resolve_font(font) != font:
+                logger.warning(f'Font "{font}" is not installed, '
+                               f'using "{resolve_font(font)}" instead')
 
     def construct(self):
         self.camera.background_color = WHITE
         self.mobjects += self.layers
+        self._at_root.update(self.layers)
         # Make sure these are in the background
         self.add(self.functions, layer=0)
 
+    def tear_down(self):
+        super().tear_down()
+        if self.dirty_regions is not None:
+            stats = self.dirty_regions.stats()
+            logger.info(f"Drew {stats['partial_frames']} frames in part "
+                        f"({stats['redrawn']:.0%} of each on average) "
+                        f"and {stats['full_frames']} whole")
+        if self.static_holds is not None and self.static_holds.holds:
+            stats = self.static_holds.stats()
+            logger.info(f"Saved sending {stats['frames_saved']} frames to ffmpeg "
+                        f"in {stats['holds']} still waits and pauses")
+        if self.profiler is not None:
+            profiling.stop(self.profiler)
+
+    def play(self, *args, **kwargs):
+        if self.profiler is None:
+            super().play(*args, **kwargs)
+        else:
+            with self.profiler.call('play'):
+                super().play(*args, **kwargs)
+        every = self.log_layer_stats_every
+        if every and self.renderer.num_plays % every == 0:
+            logger.info(f'Layers after {self.renderer.num_plays} plays:\n'
+                        + format_layer_stats(self.layer_stats()))
+
+    def layer_stats(self) -> [LayerStats]:
+        """How much is in each layer, to find what makes frames slow."""
+        # Manim redraws these on every frame and the rest only once
+        moving = set(map(id, self.moving_mobjects))
+        stats = []
+        for layer in self.layers:
+            family = layer.get_family()[1:]
+            stats.append(LayerStats(
+                layer.name,
+                len(family),
+                sum(len(m.points) for m in family),
+                sum(_array_bytes(m) for m in family),
+                sum(1 for m in family if id(m) in moving),
+            ))
+        return stats
+
+    def wait(self, *args, **kwargs):
+        if self.profiler is None:
+            return super().wait(*args, **kwargs)
+        with self.profiler.call('wait'):
+            return super().wait(*args, **kwargs)
+
+    def next_section(self, name: str = "unnamed",
+                     type: str = DefaultSectionType.NORMAL,
+                     skip_animations: bool = False):
+        self.section_starts.append(self.renderer.num_plays)
+        if not self._renders_section(len(self.section_starts) - 1):
+            skip_animations = True
+        super().next_section(name, type, skip_animations)
+
+    def checkpointed_section(self, name: str, build,
+                             skip_animations: bool = False, inputs=None):
+        """Starts a section whose body is build(), called with no arguments.
+
+        The checkpoint_state build leaves behind (and whatever it returns)
+        is saved to disk. On a later run, if this section is skipped and
+        neither it, its inputs nor any checkpointed section before it has
+        changed, that is loaded instead of running build again. Returns what
+        build returned.
+
+        inputs is anything (picklable) build depends on other than the
+        scene's checkpoint_state, such as the data a loop animates or state
+        set up outside of checkpointed sections.
+        """
+        self.next_section(name, skip_animations=skip_animations)
+        if self._checkpoint_key is not None:
+            self._checkpoint_key = checkpoint_key(
+                self._checkpoint_key, type(self).__name__, name, build,
+                self.checkpoint_state, inputs)
+        if not self.use_checkpoints or self._checkpoint_key is None:
+            return build()
+
+        skipping = (config.save_last_frame
+                    or self.renderer.file_writer.sections[-1].skip_animations)
+        if skipping:
+            state = load_checkpoint(self._checkpoint_key)
+            if state is not None:
+                self._restore_checkpoint(state)
+                return state['result']
+
+        result = build()
+        state = {attr: getattr(self, attr) for attr in self.checkpoint_state}
+        state['frame'] = self.camera.frame
+        state['result'] = result
+        save_checkpoint(self._checkpoint_key, state)
+        return result
+
+    def _restore_checkpoint(self, state: dict):
+        for attr in self.checkpoint_state:
+            setattr(self, attr, state[attr])
+        # The camera keeps its own frame, so move that one
+        self.camera.frame.become(state['frame'])
+        # Nothing in the index is in the scene any more
+        self._parents = weakref.WeakKeyDictionary()
+        self._at_root = weakref.WeakSet(self.mobjects)
+
+    def _renders_section(self, index: int) -> bool:
+        return self.sections_to_render is None or index in self.sections_to_render
+
+    def section_plays(self) -> [int]:
+        """How many plays (and waits) each section has had so far."""
+        ends = self.section_starts[1:] + [self.renderer.num_plays]
+        return [end - start for start, end in zip(self.section_starts, ends)]
+
+    def mark_static(self, *mobjects):
+        """Draws mobjects (and their submobjects) once per play, under
+        everything that moves, in plays that do not animate them. Marks are
+        not kept by checkpoints."""
+        self._marked_static.update(mobjects)
+
+    def unmark_static(self, *mobjects):
+        for mobj in mobjects:
+            self._marked_static.discard(mobj)
+
+    def get_moving_and_static_mobjects(self, animations):
+        moving, static = super().get_moving_and_static_mobjects(animations)
+        marked = [self.layers[i] for i in self.static_layers] + list(self._marked_static)
+        if not marked:
+            return moving, static
+        return keep_static(moving, static, marked, animations,
+                           self.get_mobject_family_members())
+
     def add(self, *mobjects, layer=0):
         """Adds the given mobject(s) to the specified layer."""
         self.layers[layer].add(*mobjects)
+        for mobj in mobjects:
+            self._parents[mobj] = weakref.ref(self.layers[layer])
 
     def remove(self, *mobjects):
         for mobj in mobjects:
-            remove_without_degrouping(self.mobjects, mobj)
+            path = self._indexed_path(mobj)
+            if path is not None and self.check_remove_index:
+                searched = find_path(self.mobjects, mobj)
+                # A mobject in more than one group has more than one path to
+                # it, so the two only have to both be real paths to it
+                assert self._is_path_to(path, mobj), (mobj, path)
+                assert searched is not None and self._is_path_to(searched, mobj), (
+                    mobj, path, searched)
+            if path is None:
+                path = find_path(self.mobjects, mobj)
+                if path is None:
+                    continue
+                self._remember_path(path, mobj)
+            container = path[-1].submobjects if path else self.mobjects
+            container.remove(mobj)
+            self._parents.pop(mobj, None)
+            self._at_root.discard(mobj)
+
+    def _indexed_path(self, mobj: Mobject) -> Optional[list]:
+        """The groups containing mobj (outermost first) according to the
+        parent index, or None if the index does not know or is out of date."""
+        path = []
+        node = mobj
+        while node not in self._at_root:
+            ref = self._parents.get(node)
+            parent = ref() if ref is not None else None
+            if parent is None or node not in parent.submobjects:
+                return None
+            path.insert(0, parent)
+            node = parent
+        if node not in self.mobjects:
+            return None
+        return path
+
+    def _is_path_to(self, path: list, mobj: Mobject) -> bool:
+        """Whether path (outermost first) is a chain of groups from the top
+        of the scene down to mobj."""
+        chain = path + [mobj]
+        if chain[0] not in self.mobjects:
+            return False
+        return all(child in parent.submobjects
+                   for parent, child in zip(chain, chain[1:]))
+
+    def _remember_path(self, path: list, mobj: Mobject):
+        chain = path + [mobj]
+        self._at_root.add(chain[0])
+        for parent, child in zip(chain, chain[1:]):
+            self._parents[child] = weakref.ref(parent)
 
     def set_code(self, cw: CodeWindow):
         self.add(cw)
@@ -65,15 +351,28 @@ class AnimatedCodeScene(MovingCameraScene):
     def set_variables(self, va: VariableArea):
         self.variables = va
 
+    @profiling.helper
     def move_pc(self, line: int, start: int, end: int):
         self.pc_loc = (line, start, end)
+        scroll = None
+        if isinstance(self.code_window, ScrollingCodeWindow):
+            scroll = self.code_window.scroll_to(line)
         target = self.code_window[f'line_{line}'][start:end]
+        new_pc = create_pc(target)
+        if scroll is not None:
+            # Where target will be once scrolled
+            new_pc.shift(scroll.offset)
         if not self.pc:
-            self.pc = create_pc(target)
+            self.pc = new_pc
             self.add(self.pc, layer=len(self.layers) - 1)
-            return Create(self.pc)
-        new_pc = create_pc(target)
-        return Transform(self.pc, new_pc)
+            anim = Create(self.pc)
+        else:
+            anim = Transform(self.pc, new_pc)
+        if scroll is not None:
+            # Grouped by the code window, which is in the scene already, so
+            # manim does not add a Group of its own to it
+            return AnimationGroup(scroll, anim, group=self.code_window)
+        return anim
 
     def pc_end_scope(self, line: int, scope_type: str, indents=0,
                      with_anims=[]):
@@ -86,12 +385,19 @@ class AnimatedCodeScene(MovingCameraScene):
         else:
             assert False # unsupported
 
+        scroll = None
+        if isinstance(self.code_window, ScrollingCodeWindow):
+            scroll = self.code_window.scroll_to(line)
         end_of_line = Rectangle(height=0.05, width=0.3, stroke_width=self.pc.stroke_width,
                                 color=PC_COLOR, name="Program Counter")
         end_of_line.align_to(self.code_window[f'label_{line}'].get_bottom(), align)
         # FIXME remove hard-coded indent width
         end_of_line.align_to(self.code_window.code_area.get_left() + 0.32 * indents, LEFT)
-        self.play(Transform(self.pc, end_of_line), *with_anims)
+        anims = [Transform(self.pc, end_of_line)]
+        if scroll is not None:
+            end_of_line.shift(scroll.offset)
+            anims.append(scroll)
+        self.play(*anims, *with_anims)
 
     def create_variable(self, name: str, value,
                         source=None, shift_down: [Mobject] = [],
@@ -121,8 +427,7 @@ class AnimatedCodeScene(MovingCameraScene):
             self.remove(source)
             # Create the box, animating each part individually, otherwise Manim
             # will add the VGroup of them all, breaking apart the scope
-            self.play(*[part.animate.set_opacity(1.0) for part in new_box.all_but_contents()],
-                      run_time=0.7)
+            self.play(*fade_opacity(new_box.all_but_contents()), run_time=0.7)
             # Fill the box by making it look like how it was originally created.
             anims = [Transform(new_box['contents'], target_contents)]
             if move_pointer is not None:
@@ -135,10 +440,9 @@ class AnimatedCodeScene(MovingCameraScene):
             assert new_box in scope.submobjects
         else:
             if show_value:
-                self.play(new_box.animate.set_opacity(1.0), run_time=1.0)
+                self.play(FadeOpacity(new_box), run_time=1.0)
             else:
-                self.play(*[part.animate.set_opacity(1.0) for part in new_box.all_but_contents()],
-                          run_time=1.0)
+                self.play(*fade_opacity(new_box.all_but_contents()), run_time=1.0)
         return new_box
 
     def update_variable(self, name, new_content, source):
@@ -198,6 +502,7 @@ class AnimatedCodeScene(MovingCameraScene):
         self.play(ReplacementTransform(operation_grp, result_txt))
         return result_txt, result
 
+    @profiling.helper
     def highlight_scope(self, scope_type: str, lines=1, indents=0,
                         loc=None):
         # assume current PC is on the keyword
@@ -205,8 +510,18 @@ class AnimatedCodeScene(MovingCameraScene):
             loc = self.pc_loc
         else:
             assert len(loc) == 3
-        return self.code_window.highlight_scope(scope_type, lines, indents,
-                                                loc[0], loc[1], loc[2])
+        scroll = None
+        if isinstance(self.code_window, ScrollingCodeWindow):
+            scroll = self.code_window.scroll_to(loc[0], loc[0] + lines)
+        highlight = self.code_window.highlight_scope(scope_type, lines, indents,
+                                                     loc[0], loc[1], loc[2])
+        if scroll is None:
+            return highlight
+        # Take the PC along with the code
+        anims = [scroll, highlight]
+        if self.pc:
+            anims.append(self.pc.animate.shift(scroll.offset))
+        return AnimationGroup(*anims, group=self.code_window)
 
     def set_functions_anchor(self, point):
         self.functions.next_to(point, DOWN, buff=0)
@@ -221,7 +536,7 @@ class AnimatedCodeScene(MovingCameraScene):
         user_fn.next_to(anchor, DOWN, buff=INTRA_FUNCTION_BUFFER)
         user_fn.set_opacity(0)
         self.functions.add(user_fn)
-        self.play(user_fn['box'].animate.set_opacity(1))
+        self.play(FadeOpacity(user_fn['box']))
 
         code_copy = code_group.copy().scale_to_fit_width(user_fn['box'].width - 0.1)
         code_copy.move_to(user_fn['box'])
@@ -236,7 +551,7 @@ class AnimatedCodeScene(MovingCameraScene):
 
         fn_parts_box2 = SurroundingRectangle(user_fn['label'], color=SECONDARY_RECT_COLOR,
                                              buff=0.1, corner_radius=0.1)
-        self.play(Create(fn_parts_box2), user_fn['label'].animate.set_opacity(1.0))
+        self.play(Create(fn_parts_box2), FadeOpacity(user_fn['label']))
         self.pause()
 
         anims = [surround(fn_parts_box1, inputs_group)]
@@ -247,7 +562,7 @@ class AnimatedCodeScene(MovingCameraScene):
         else:
             anims.append(surround(fn_parts_box2, user_fn.all_inputs()))
             for i in range(1, user_fn.num_inputs + 1):
-                anims.append(user_fn[f'input_{i}'].animate.set_opacity(1.0))
+                anims.append(FadeOpacity(user_fn[f'input_{i}']))
         self.play(*anims)
         self.pause()
 
@@ -257,7 +572,7 @@ class AnimatedCodeScene(MovingCameraScene):
                               offset=RIGHT * (user_fn['box'].width + 0.2))]
         else:
             anims = [
-                user_fn['output_1'].animate.set_opacity(1.0),
+                FadeOpacity(user_fn['output_1']),
                 surround(fn_parts_box2, user_fn['output_1'])
             ]
 
@@ -274,6 +589,7 @@ class AnimatedCodeScene(MovingCameraScene):
         self.play(FadeOut(*boxes_to_remove))
         self.remove(*boxes_to_remove)
 
+    @profiling.helper
     def push_pc(self, line, start, end, init_pc):
         self.pc_stack.append([self.pc, self.pc_loc])
         # Make sure we only have one PC in the top layer
@@ -293,7 +609,22 @@ class AnimatedCodeScene(MovingCameraScene):
         self.pc_loc = popped[1]
         self.remove(self.pc)
         self.add(self.pc, layer=len(self.layers) - 1)
-
+        if isinstance(self.code_window, ScrollingCodeWindow):
+            # The code may have scrolled since the call, leaving this PC
+            # where its line used to be
+            line, start, end = self.pc_loc
+            scroll = self.code_window.scroll_to(line)
+            new_pc = create_pc(self.code_window[f'line_{line}'][start:end])
+            anims = []
+            if scroll is not None:
+                new_pc.shift(scroll.offset)
+                anims.append(scroll)
+            if not np.allclose(new_pc.get_center(), self.pc.get_center()):
+                anims.append(Transform(self.pc, new_pc))
+            if anims:
+                self.play(*anims)
+
+    @profiling.helper
     def cross_fade(self, start, stop, layer=0):
         temp_stop = stop.copy().move_to(start).set_opacity(0).scale_to_fit_height(start.height)
         self.remove(start)
@@ -312,14 +643,33 @@ class AnimatedCodeScene(MovingCameraScene):
         return self.variables.top_scope()[name]
 
 
-def remove_without_degrouping(mobjects: [Mobject], target: Mobject):
+def format_layer_stats(stats: [LayerStats]) -> str:
+    lines = [f"{'layer':20} {'mobjects':>9} {'moving':>7} {'points':>9} {'memory':>9}"]
+    for layer in stats:
+        lines.append(f'{layer.name:20} {layer.mobjects:9} {layer.moving:7} '
+                     f'{layer.points:9} {layer.bytes / 1024:8.0f}K')
+    return '\n'.join(lines)
+
+
+def find_path(mobjects: [Mobject], target: Mobject) -> Optional[list]:
+    """Depth-first search for target. Returns the groups leading to it
+    (outermost first), [] if it is in mobjects or None if it is not found."""
     if target in mobjects:
-        mobjects.remove(target)
-        return True
+        return []
     for m in mobjects:
-        if remove_without_degrouping(m.submobjects, target):
-            return True
-    return False
+        path = find_path(m.submobjects, target)
+        if path is not None:
+            return [m] + path
+    return None
+
+
+def remove_without_degrouping(mobjects: [Mobject], target: Mobject):
+    path = find_path(mobjects, target)
+    if path is None:
+        return False
+    container = path[-1].submobjects if path else mobjects
+    container.remove(target)
+    return True
 
 
 def create_pc(target: Mobject):
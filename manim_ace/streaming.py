@@ -0,0 +1,159 @@
+from manim import *
+
+import shutil
+import subprocess
+
+from manim import __version__
+from pathlib import Path
+from pydub import AudioSegment
+from typing import Optional
+
+
+class StreamingWriter:
+    """Writes a whole scene through one ffmpeg process.
+
+    Manim starts ffmpeg for every play and wait, each writing its own
+    partial movie file, then joins them all at the end. For a code scene
+    with hundreds of short plays, starting ffmpeg costs more than encoding.
+    This keeps one ffmpeg open for the whole scene, writes each frame
+    straight from the camera's pixel array, and marks where each section
+    starts with a chapter instead of a separate file.
+
+    Since there are no partial movie files, plays are never taken from
+    manim's cache, and save_sections only gives the chapters.
+    """
+
+    def __init__(self, scene: Scene, preset: Optional[str] = None):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.camera = scene.renderer.camera
+        self.file_writer = scene.renderer.file_writer
+        self.preset = preset
+        self.process = None
+        self.frames = 0
+        # [name, first frame] of each section
+        self.chapters = [[self.file_writer.sections[-1].name, 0]]
+
+        file_writer = self.file_writer
+        self.stream_path = file_writer.movie_file_path.with_name(
+            f'{file_writer.movie_file_path.stem}_stream{file_writer.movie_file_path.suffix}')
+        self._next_section = file_writer.next_section
+        file_writer.next_section = self.next_section
+        file_writer.is_already_cached = lambda hash_invocation: False
+        file_writer.begin_animation = self.begin_animation
+        file_writer.end_animation = lambda allow_write=False: None
+        file_writer.write_frame = self.write_frame
+        file_writer.combine_to_movie = self.combine_to_movie
+        file_writer.combine_to_section_videos = lambda: None
+        self.renderer.render = self.render
+
+    def next_section(self, name: str, type: str, skip_animations: bool):
+        self.chapters.append([name, self.frames])
+        self._next_section(name, type, skip_animations)
+
+    def _command(self) -> [str]:
+        fps = config['frame_rate']
+        if fps == int(fps):
+            fps = int(fps)
+        # As in SceneFileWriter.open_movie_pipe
+        command = [
+            config.ffmpeg_executable,
+            '-y',
+            '-f', 'rawvideo',
+            '-s', '%dx%d' % (config['pixel_width'], config['pixel_height']),
+            '-pix_fmt', 'rgba',
+            '-r', str(fps),
+            '-i', '-',
+            '-an',
+            '-loglevel', config['ffmpeg_loglevel'].lower(),
+        ]
+        if is_webm_format():
+            command += ['-vcodec', 'libvpx-vp9', '-auto-alt-ref', '0']
+        elif config['transparent']:
+            command += ['-vcodec', 'qtrle']
+        else:
+            command += ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']
+            if self.preset:
+                command += ['-preset', self.preset]
+        return command + [str(self.stream_path)]
+
+    def begin_animation(self, allow_write: bool = False, file_path=None):
+        if allow_write and self.process is None:
+            self.process = subprocess.Popen(self._command(), stdin=subprocess.PIPE)
+
+    def render(self, scene: Scene, time: float, moving_mobjects: [Mobject]):
+        # As CairoRenderer.render, but without copying the frame first
+        self.renderer.update_frame(scene, moving_mobjects)
+        self.renderer.add_frame(self.camera.pixel_array)
+
+    def write_frame(self, frame: np.ndarray):
+        if not frame.flags.c_contiguous:
+            frame = np.ascontiguousarray(frame)
+        self.process.stdin.write(frame.data)
+        self.frames += 1
+
+    def _chapter_metadata(self) -> Optional[str]:
+        """An ffmpeg metadata file of the sections that have frames, or None
+        if there are not at least two."""
+        chapters = []
+        ends = [start for _, start in self.chapters[1:]] + [self.frames]
+        for (name, start), end in zip(self.chapters, ends):
+            if end > start:
+                chapters.append((name, start, end))
+        if len(chapters) < 2:
+            return None
+
+        to_ms = 1000 / config['frame_rate']
+        lines = [';FFMETADATA1']
+        for name, start, end in chapters:
+            # = ; # \ and newlines have to be escaped
+            title = ''.join('\\' + c if c in '=;#\\\n' else c for c in name)
+            lines += ['[CHAPTER]', 'TIMEBASE=1/1000', f'START={round(start * to_ms)}',
+                      f'END={round(end * to_ms)}', f'title={title}']
+        return '\n'.join(lines) + '\n'
+
+    def combine_to_movie(self):
+        file_writer = self.file_writer
+        if self.process is None:
+            logger.info('No frames were written, so there is no movie')
+            return
+        self.process.stdin.close()
+        self.process.wait()
+        self.process = None
+
+        movie_file_path = Path(file_writer.movie_file_path)
+        metadata = self._chapter_metadata()
+        if metadata is None and not file_writer.includes_sound:
+            shutil.move(str(self.stream_path), str(movie_file_path))
+            file_writer.print_file_ready_message(str(movie_file_path))
+            return
+
+        # Add the chapters and sound without encoding the video again
+        # [path, ffmpeg options for it]
+        inputs = [[self.stream_path, []]]
+        options = ['-map', '0:v:0', '-c:v', 'copy']
+        sound_file_path = movie_file_path.with_suffix('.wav')
+        if file_writer.includes_sound:
+            # Makes sure the sound is as long as the video, as in combine_to_movie
+            file_writer.add_audio_segment(AudioSegment.silent(0))
+            file_writer.audio_segment.export(sound_file_path, bitrate='312k')
+            options += ['-map', f'{len(inputs)}:a:0', '-c:a', 'aac', '-b:a', '320k']
+            inputs.append([sound_file_path, []])
+        metadata_path = movie_file_path.with_name(f'{movie_file_path.stem}_chapters.txt')
+        if metadata is not None:
+            metadata_path.write_text(metadata, encoding='utf-8')
+            options += ['-map_chapters', str(len(inputs))]
+            inputs.append([metadata_path, ['-f', 'ffmetadata']])
+
+        command = [config.ffmpeg_executable, '-y']
+        for path, input_options in inputs:
+            command += input_options + ['-i', str(path)]
+        command += options + [
+            '-loglevel', config.ffmpeg_loglevel.lower(),
+            '-metadata', f'comment=Rendered with Manim Community v{__version__}',
+            str(movie_file_path),
+        ]
+        subprocess.call(command)
+        for path, _ in inputs:
+            path.unlink()
+        file_writer.print_file_ready_message(str(movie_file_path))
@@ -0,0 +1,70 @@
+from manim import *
+
+from collections import OrderedDict
+from typing import Optional
+
+from .fonts import resolve_font
+
+
+class TextCache:
+    """An LRU cache of pre-built Text mobjects.
+
+    Building a Text goes through Pango every time, even for strings we have
+    rendered hundreds of times already. This keeps one pristine Text per
+    (string, font, font_size, color) and hands out copies of it.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, s: str, font: str, font_size: float,
+            color: Optional[str] = None, text_class=Text) -> Text:
+        key = (text_class, s, font, font_size, color)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return cached.copy()
+
+        self.misses += 1
+        kwargs = {'font': resolve_font(font), 'font_size': font_size}
+        if color is not None:
+            kwargs['color'] = color
+        cached = text_class(s, **kwargs)
+        self._entries[key] = cached
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return cached.copy()
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by all of manim_ace. Use text_cache.stats() to see how well it is
+# doing for a given scene.
+text_cache = TextCache()
+
+
+def cached_text(s: str, font: str, font_size: float,
+                color: Optional[str] = None, text_class=Text) -> Text:
+    """Returns a fresh copy of the Text for s, building it only once."""
+    return text_cache.get(s, font, font_size, color=color,
+                          text_class=text_class)
@@ -0,0 +1,272 @@
+from manim import *
+
+from typing import NamedTuple, Optional
+
+from .trace import (CALL, LINE, ASSIGN, RETURN, ExecutionTrace, TraceEvent,
+                    TraceReplayer)
+
+# Kinds of TimelineStep
+EVENT = 'event'        # one event, replayed by TraceReplayer as usual
+MERGED = 'merged'      # variable updates and the next PC move in one play
+MONTAGE = 'montage'    # many repeated loop iterations in one play
+
+# How many plays TraceReplayer makes for each kind of event. Shelf expansions
+# in create_variable are not counted, they happen either way.
+_CREATE_PLAYS = 2
+_UPDATE_PLAYS = 1
+
+
+class TimelineStep(NamedTuple):
+    kind: str
+    events: tuple
+    # For MONTAGE, the last value of every variable that changed
+    final_values: tuple = ()
+    # For MONTAGE, how many loop iterations it stands for
+    iterations: int = 0
+
+
+class Timeline:
+    """What compile_trace turned an ExecutionTrace into."""
+
+    def __init__(self, trace: ExecutionTrace):
+        self.trace = trace
+        self.steps = []
+        self.naive_plays = 0
+        self.compiled_plays = 0
+        self.merged = 0
+        self.elided = 0
+        self.montages = 0
+
+    @property
+    def plays_saved(self) -> int:
+        return self.naive_plays - self.compiled_plays
+
+    def report(self) -> str:
+        return (f'{self.compiled_plays} plays instead of {self.naive_plays} '
+                f'({self.plays_saved} saved: {self.merged} merged, '
+                f'{self.elided} no-op moves, {self.montages} montages)')
+
+
+def _key(event: TraceEvent) -> tuple:
+    """Events with the same key look the same, apart from the values."""
+    return (event.kind, event.line, event.start, event.end, event.depth,
+            tuple(name for name, _ in event.changes))
+
+
+def _event_plays(event: TraceEvent, scope: set) -> int:
+    if event.kind == LINE:
+        return 1
+    if event.kind == ASSIGN:
+        return sum(_UPDATE_PLAYS if name in scope else _CREATE_PLAYS
+                   for name, _ in event.changes)
+    if event.kind == CALL:
+        return 1 + _CREATE_PLAYS * len(event.changes)
+    return 1
+
+
+def _find_repeats(keys: list, kinds: list, i: int, max_period: int,
+                  threshold: int) -> Optional[tuple]:
+    """Looks for a block of events starting at i that repeats at least
+    threshold times in a row. Returns (period, repeats) or None."""
+    for period in range(1, max_period + 1):
+        if i + period * threshold > len(keys):
+            break
+        if kinds[i + period - 1] in (CALL, RETURN):
+            # Calls need their scopes pushed and popped, so they cannot
+            # be skipped over. Longer blocks would include this too.
+            break
+        if keys[i] != keys[i + period]:
+            continue
+        block = keys[i:i + period]
+        repeats = 1
+        while keys[i + repeats * period:i + (repeats + 1) * period] == block:
+            repeats += 1
+        if repeats >= threshold:
+            return period, repeats
+    return None
+
+
+class _Compiler:
+
+    def __init__(self, trace: ExecutionTrace, montage_threshold: int,
+                 keep_iterations: int, max_period: int):
+        self.timeline = Timeline(trace)
+        self.events = list(trace)
+        self.keys = [_key(e) for e in self.events]
+        self.kinds = [e.kind for e in self.events]
+        self.montage_threshold = montage_threshold
+        self.keep_iterations = keep_iterations
+        self.max_period = max_period
+        # Names of the variables that exist for each function call
+        self.scopes = [set()]
+        # (line, start, end) of the PC, once it has moved
+        self.pc = None
+        # Where the PC was before each function call, as in scene.pc_stack
+        self.pc_stack = []
+
+    def take(self, event: TraceEvent) -> int:
+        """Keeps track of what the scene will look like after event. Returns
+        the plays TraceReplayer would have used for it."""
+        plays = _event_plays(event, self.scopes[-1])
+        self.timeline.naive_plays += plays
+        if event.kind == CALL:
+            self.scopes.append(set(name for name, _ in event.changes))
+            # push_pc moves the PC to the function's definition
+            self.pc_stack.append(self.pc)
+            self.pc = event.line, event.start, event.end
+        elif event.kind == RETURN:
+            self.scopes.pop()
+            # and pop_pc brings back the one from before the call
+            self.pc = self.pc_stack.pop()
+        elif event.kind == ASSIGN:
+            self.scopes[-1].update(name for name, _ in event.changes)
+        elif event.kind == LINE:
+            self.pc = event.line, event.start, event.end
+        return plays
+
+    def add(self, step: TimelineStep, plays: int):
+        self.timeline.steps.append(step)
+        self.timeline.compiled_plays += plays
+
+    def compile(self) -> Timeline:
+        i = 0
+        while i < len(self.events):
+            repeats = None
+            if self.montage_threshold > 0 and self.kinds[i] != ASSIGN:
+                repeats = _find_repeats(self.keys, self.kinds, i, self.max_period,
+                                        max(self.montage_threshold,
+                                            self.keep_iterations + 1))
+            if repeats is None:
+                i = self.compile_event(i, len(self.events))
+                continue
+
+            period, count = repeats
+            skip_from = i + period * self.keep_iterations
+            skip_to = i + period * count
+            # Show the first few iterations as usual...
+            while i < skip_from:
+                i = self.compile_event(i, skip_from)
+            # ...then jump to the end of the rest.
+            skipped = self.events[skip_from:skip_to]
+            final_values = {}
+            for event in skipped:
+                if event.kind == ASSIGN:
+                    final_values.update(event.changes)
+            self.add(TimelineStep(MONTAGE, tuple(skipped),
+                                  tuple(final_values.items()),
+                                  count - self.keep_iterations),
+                     self.montage_plays(skipped, final_values))
+            for event in skipped:
+                self.take(event)
+            self.timeline.montages += 1
+            i = skip_to
+        return self.timeline
+
+    def montage_plays(self, skipped: list, final_values: dict) -> int:
+        """The plays TimelineReplayer.on_montage makes. Variables first
+        seen in the skipped iterations are created as usual, the rest are
+        played together with the last PC move."""
+        new = sum(name not in self.scopes[-1] for name in final_values)
+        together = (len(final_values) > new
+                    or any(event.kind == LINE for event in skipped))
+        return _CREATE_PLAYS * new + together
+
+    def compile_event(self, i: int, stop: int) -> int:
+        """Adds the step for events[i], merging it with events[i + 1] if
+        that is before stop. Returns the index of the next event."""
+        event = self.events[i]
+        if event.kind == LINE and (event.line, event.start, event.end) == self.pc:
+            self.take(event)
+            self.timeline.elided += 1
+            return i + 1
+
+        following = self.events[i + 1] if i + 1 < stop else None
+        if (event.kind == ASSIGN and following is not None
+                and following.kind == LINE
+                and (following.line, following.start, following.end) != self.pc
+                and all(name in self.scopes[-1] for name, _ in event.changes)):
+            plays = self.take(event) + self.take(following)
+            self.add(TimelineStep(MERGED, (event, following)), 1)
+            self.timeline.merged += plays - 1
+            return i + 2
+
+        self.add(TimelineStep(EVENT, (event,)), self.take(event))
+        return i + 1
+
+
+def compile_trace(trace: ExecutionTrace, montage_threshold: int = 4,
+                  keep_iterations: int = 2, max_period: int = 64) -> Timeline:
+    """Turns a trace into as few plays as it reasonably can.
+
+    - Moving the PC to where it already is does nothing, so it is dropped.
+    - Updating existing variables and then moving the PC touch different
+      mobjects, so they are played together.
+    - A block of events (e.g. a loop body) repeated at least
+      montage_threshold times is shown keep_iterations times, then the rest
+      of the repeats become a single montage to the final values.
+
+    Set montage_threshold to 0 to never make montages.
+    """
+    return _Compiler(trace, montage_threshold, keep_iterations,
+                     max_period).compile()
+
+
+class TimelineReplayer(TraceReplayer):
+    """Animates a Timeline from compile_trace."""
+
+    def __init__(self, scene, timeline: Timeline, wait: float = 0.2,
+                 montage_run_time: float = 0.5):
+        super().__init__(scene, timeline.trace, wait=wait)
+        self.timeline = timeline
+        self.montage_run_time = montage_run_time
+
+    def replay_timeline(self):
+        for step in self.timeline.steps:
+            if step.kind == EVENT:
+                self.handle(step.events[0])
+            elif step.kind == MERGED:
+                self.on_merged(*step.events)
+            elif step.kind == MONTAGE:
+                self.on_montage(step)
+            else:
+                assert False, step
+
+    def _update_anims(self, name: str, value, source: Mobject) -> [Animation]:
+        return self.scene.get_variable(name).update_contents(value, source)
+
+    def on_merged(self, assign: TraceEvent, line: TraceEvent):
+        anims = []
+        for name, value in assign.changes:
+            anims += self._update_anims(name, value,
+                                        self.value_source(assign, name))
+        anims.append(self.scene.move_pc(self.code_line(line.line),
+                                        line.start, line.end))
+        self.scene.play(*anims)
+        self.scene.wait(self.wait)
+
+    def on_montage(self, step: TimelineStep):
+        anims = []
+        for name, value in step.final_values:
+            if name not in self.scopes[-1]:
+                # Only seen in the skipped iterations, so show it properly
+                self.scene.create_variable(name, value)
+                self.scopes[-1].add(name)
+                continue
+            contents = self.scene.get_variable(name)['contents'].copy()
+            anims += self._update_anims(name, value, contents)
+        lines = [e for e in step.events if e.kind == LINE]
+        if lines:
+            anims.append(self.scene.move_pc(self.code_line(lines[-1].line),
+                                            lines[-1].start, lines[-1].end))
+        if anims:
+            self.scene.play(*anims, run_time=self.montage_run_time)
+        self.scene.wait(self.wait)
+
+
+def replay_compiled(scene, trace: ExecutionTrace, wait: float = 0.2,
+                    **compile_args) -> Timeline:
+    """Compiles and animates trace, logging how many plays that saved."""
+    timeline = compile_trace(trace, **compile_args)
+    logger.info(f'manim_ace timeline: {timeline.report()}')
+    TimelineReplayer(scene, timeline, wait=wait).replay_timeline()
+    return timeline
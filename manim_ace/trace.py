@@ -0,0 +1,376 @@
+from manim import *
+
+import contextlib
+import dis
+import inspect
+import io
+import re
+import sys
+
+from array import array
+from typing import NamedTuple, Optional
+
+from .scene import AnimatedCodeScene, create_pc
+from .variables import code_value
+
+# Kinds of TraceEvent
+CALL = 0
+LINE = 1
+ASSIGN = 2
+RETURN = 3
+
+# Stored in place of None for "the rest of the line"
+_TO_END = -2 ** 31
+
+_TRACE_FILENAME = '<manim_ace trace>'
+
+
+class TraceEvent(NamedTuple):
+    kind: int
+    # Line numbers are lines of the traced source (1 is the first line).
+    line: int
+    # start and end index into the CodeWindow line, like move_pc
+    start: int
+    end: Optional[int]
+    # 0 is the module, 1 is a function called from there, etc
+    depth: int
+    # ((name, value), ...) for ASSIGN and CALL, (('return', value),) for RETURN
+    changes: tuple
+
+
+class Placeholder:
+    """Stands in for values too big to show in a VariableBox, like lists."""
+
+    def __init__(self, type_name: str):
+        self.type_name = type_name
+
+    def __str__(self):
+        return f'<{self.type_name}>'
+
+    def __repr__(self):
+        return str(self)
+
+    def __eq__(self, other):
+        return isinstance(other, Placeholder) and other.type_name == self.type_name
+
+
+_SHOWN_TYPES = (int, float, str, bool, type(None))
+
+
+def _fingerprint(value):
+    # Compare simple values by value and everything else by identity. This
+    # means mutating a list is not a change, but it also means we never copy
+    # or walk a big data structure on every line.
+    if isinstance(value, _SHOWN_TYPES):
+        return (type(value), value)
+    return id(value)
+
+
+def _shown_value(value):
+    if isinstance(value, _SHOWN_TYPES):
+        return value
+    return Placeholder(type(value).__name__)
+
+
+def _is_variable(name: str, value) -> bool:
+    # Comprehensions have hidden locals like .0
+    if name.startswith('__') or not name.isidentifier():
+        return False
+    return not (callable(value) or isinstance(value, type(sys)))
+
+
+# Code flags of functions that can stop and carry on later
+_RESUMABLE = (inspect.CO_GENERATOR | inspect.CO_COROUTINE
+              | inspect.CO_ASYNC_GENERATOR)
+_RESUME = dis.opmap.get('RESUME')
+
+
+def _is_resume(frame) -> bool:
+    """Whether a call event is a generator (or coroutine) carrying on after
+    a yield, rather than starting."""
+    if not frame.f_code.co_flags & _RESUMABLE or frame.f_lasti < 0:
+        return False
+    code = frame.f_code.co_code
+    if _RESUME is not None and code[frame.f_lasti] == _RESUME:
+        # The argument of RESUME is 0 at the start of the function
+        return code[frame.f_lasti + 1] & 3 != 0
+    # Before Python 3.11, f_lasti is -1 until the frame starts
+    return True
+
+
+class ExecutionTrace:
+    """The events from running some source code, stored in flat arrays so
+    that long runs stay small and cheap to record."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.source_lines = source.split('\n')
+        self.kinds = array('b')
+        self.lines = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.depths = array('i')
+        # index into self.changes, or -1
+        self.change_ids = array('i')
+        self.changes = []
+        self.stdout = ''
+        self.error: Optional[BaseException] = None
+
+    def append(self, kind: int, line: int, start: int, end: Optional[int],
+               depth: int, changes: tuple = ()):
+        self.kinds.append(kind)
+        self.lines.append(line)
+        self.starts.append(start)
+        self.ends.append(_TO_END if end is None else end)
+        self.depths.append(depth)
+        if changes:
+            self.change_ids.append(len(self.changes))
+            self.changes.append(changes)
+        else:
+            self.change_ids.append(-1)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, i: int) -> TraceEvent:
+        end = self.ends[i]
+        change_id = self.change_ids[i]
+        return TraceEvent(self.kinds[i], self.lines[i], self.starts[i],
+                          None if end == _TO_END else end, self.depths[i],
+                          self.changes[change_id] if change_id >= 0 else ())
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self[i]
+
+    def leading_blank_lines(self) -> int:
+        """Pygments drops blank lines at the start, so CodeWindow does too."""
+        return len(self.source) - len(self.source.lstrip('\n'))
+
+
+class Recorder:
+    """Runs source code under sys.settrace, recording an ExecutionTrace.
+
+    Comprehensions, generator expressions and lambdas are not traced, only
+    what they leave in the frame that runs them. A generator is shown as a
+    call up to its first yield; after that it runs without being traced.
+    """
+
+    def __init__(self, source: str, max_events: int = 1_000_000):
+        self.trace = ExecutionTrace(source)
+        self.max_events = max_events
+        self.depth = -1
+        # frame -> {name: fingerprint} as of its last event
+        self.snapshots = {}
+        # frame -> (line, start, end) of the line it is running
+        self.current_lines = {}
+        # code object -> {line: (start column, end column)}
+        self.spans = {}
+
+    def run(self, global_vars: Optional[dict] = None) -> ExecutionTrace:
+        code = compile(self.trace.source, _TRACE_FILENAME, 'exec')
+        if global_vars is None:
+            global_vars = {'__name__': '__main__'}
+        stdout = io.StringIO()
+        old_trace = sys.gettrace()
+        sys.settrace(self._global_trace)
+        try:
+            with contextlib.redirect_stdout(stdout):
+                exec(code, global_vars)
+        except Exception as e:
+            self.trace.error = e
+        finally:
+            sys.settrace(old_trace)
+            self.trace.stdout = stdout.getvalue()
+        return self.trace
+
+    def _global_trace(self, frame, event, arg):
+        if frame.f_code.co_filename != _TRACE_FILENAME:
+            # Do not trace library code at all
+            return None
+        if self.depth >= 0 and (frame.f_code.co_name.startswith('<')
+                                or _is_resume(frame)):
+            # <listcomp>, <genexpr>, <lambda> and the like, or a generator
+            # that was already shown. A resumed frame keeps the local trace
+            # it had unless it is cleared.
+            frame.f_trace = None
+            return None
+        if event == 'call':
+            self.depth += 1
+            self.snapshots[frame] = {}
+            if self.depth > 0:
+                start, end = self._def_span(frame.f_code.co_firstlineno)
+                self._append(CALL, frame.f_code.co_firstlineno, start, end,
+                             self._changes(frame))
+        return self._local_trace
+
+    def _local_trace(self, frame, event, arg):
+        if event == 'line':
+            current = (frame.f_lineno,
+                       *self._line_span(frame.f_code, frame.f_lineno))
+            changes = self._changes(frame)
+            if changes:
+                # These happened on the line before this one
+                self._append(ASSIGN, *self.current_lines.get(frame, current),
+                             changes)
+            self.current_lines[frame] = current
+            self._append(LINE, *current)
+        elif event == 'return':
+            current = self.current_lines.pop(frame, None)
+            if current is None:
+                current = (frame.f_lineno,
+                           *self._line_span(frame.f_code, frame.f_lineno))
+            changes = self._changes(frame)
+            if changes:
+                self._append(ASSIGN, *current, changes)
+            if self.depth > 0:
+                self._append(RETURN, *current,
+                             (('return', _shown_value(arg)),))
+            del self.snapshots[frame]
+            self.depth -= 1
+        return self._local_trace
+
+    def _append(self, kind, line, start, end, changes=()):
+        if len(self.trace) >= self.max_events:
+            raise RuntimeError(f'Stopped tracing after {self.max_events} events')
+        self.trace.append(kind, line, start, end, self.depth, changes)
+
+    def _changes(self, frame) -> tuple:
+        """The variables that are new or different since the last event."""
+        snapshot = self.snapshots[frame]
+        changes = []
+        for name, value in frame.f_locals.items():
+            if not _is_variable(name, value):
+                continue
+            fingerprint = _fingerprint(value)
+            if snapshot.get(name, snapshot) != fingerprint:
+                snapshot[name] = fingerprint
+                changes.append((name, _shown_value(value)))
+        return tuple(changes)
+
+    def _indent(self, line: int) -> int:
+        text = self.trace.source_lines[line - 1]
+        return len(text) - len(text.lstrip())
+
+    def _line_span(self, code, line: int) -> (int, Optional[int]):
+        """Where the statement on a line starts and ends, as indices into
+        the CodeWindow line (which has no leading whitespace)."""
+        spans = self.spans.get(code)
+        if spans is None:
+            spans = {}
+            # co_positions is only in Python 3.11+
+            for start_line, end_line, start, end in getattr(code, 'co_positions', lambda: [])():
+                if start_line is None or start_line != end_line or end is None:
+                    continue
+                spans[start_line] = max(spans.get(start_line, end), end)
+            self.spans[code] = spans
+        if line not in spans:
+            return 0, None
+        # Keywords like for and if have no positions of their own, so every
+        # statement is taken to start at the beginning of the line.
+        return 0, max(0, spans[line] - self._indent(line))
+
+    def _def_span(self, line: int) -> (int, Optional[int]):
+        text = self.trace.source_lines[line - 1].strip()
+        end = text.rfind(':')
+        return 0, (end if end > 0 else None)
+
+
+def record(source: str, global_vars: Optional[dict] = None,
+           max_events: int = 1_000_000) -> ExecutionTrace:
+    """Runs source and returns what happened, line by line.
+
+    Anything the code prints is kept in the trace's stdout. An exception
+    stops the recording and is kept as the trace's error.
+    """
+    return Recorder(source, max_events=max_events).run(global_vars)
+
+
+class TraceReplayer:
+    """Animates an ExecutionTrace on an AnimatedCodeScene.
+
+    The scene needs its CodeWindow (showing the same source) and
+    VariableArea set. Override the on_* methods to change how each kind of
+    event is shown.
+    """
+
+    def __init__(self, scene: AnimatedCodeScene, trace: ExecutionTrace,
+                 wait: float = 0.2):
+        self.scene = scene
+        self.trace = trace
+        self.wait = wait
+        self.line_offset = (scene.code_window.line_offset
+                            - trace.leading_blank_lines())
+        # Names of the variables shown for each function call
+        self.scopes = [set()]
+
+    def code_line(self, line: int) -> int:
+        """The CodeWindow line for a line of the traced source."""
+        return line + self.line_offset
+
+    def replay(self, start: int = 0, stop: Optional[int] = None):
+        if stop is None:
+            stop = len(self.trace)
+        for i in range(start, stop):
+            self.handle(self.trace[i])
+
+    def handle(self, event: TraceEvent):
+        if event.kind == LINE:
+            self.on_line(event)
+        elif event.kind == ASSIGN:
+            self.on_assign(event)
+        elif event.kind == CALL:
+            self.on_call(event)
+        elif event.kind == RETURN:
+            self.on_return(event)
+        else:
+            assert False, event
+
+    def on_line(self, event: TraceEvent):
+        self.scene.play(self.scene.move_pc(self.code_line(event.line),
+                                           event.start, event.end))
+        self.scene.wait(self.wait)
+
+    def on_assign(self, event: TraceEvent):
+        for name, value in event.changes:
+            source = self.value_source(event, name)
+            if name in self.scopes[-1]:
+                self.scene.update_variable(name, value, source)
+            else:
+                self.scene.create_variable(name, value, source=source)
+                self.scopes[-1].add(name)
+        self.scene.wait(self.wait)
+
+    def on_call(self, event: TraceEvent):
+        scene = self.scene
+        line, start, end = scene.pc_loc
+        init_pc = create_pc(scene.code_window[f'line_{line}'][start:end])
+        scene.play(scene.push_pc(self.code_line(event.line), event.start,
+                                 event.end, init_pc),
+                   scene.variables.push_variable_stack())
+        self.scopes.append(set())
+        self.on_assign(event)
+
+    def on_return(self, event: TraceEvent):
+        self.scene.variables.pop_variable_stack(self.scene)
+        self.scopes.pop()
+        self.scene.pop_pc()
+        self.scene.wait(self.wait)
+
+    def value_source(self, event: TraceEvent, name: str) -> Mobject:
+        """What flies into a variable's box when it gets a value: the right
+        hand side of a simple assignment, or else the whole statement."""
+        line = self.code_line(event.line)
+        code_line = self.scene.code_window[f'line_{line}']
+        if len(code_line) == 0:
+            return code_value(dict(event.changes)[name])
+        text = self.trace.source_lines[event.line - 1].strip()
+        match = re.match(rf'{re.escape(name)}\s*=\s*(?!=)', text)
+        if match and match.end() < len(text):
+            return code_line[match.end():len(text)].copy()
+        return code_line[event.start:event.end].copy()
+
+
+def replay(scene: AnimatedCodeScene, trace: ExecutionTrace, wait: float = 0.2):
+    """Animates every event in trace. See TraceReplayer."""
+    TraceReplayer(scene, trace, wait=wait).replay()
@@ -1,8 +1,10 @@
 from manim import *
 
+from . import profiling
 from .colors import LIGHT_BROWN
 from .fonts import LM_MONO, ROBOTO_MONO
-from .lists import List
+from .lists import cell_text
+from .text_cache import cached_text
 
 SHELF_COLOR = LIGHT_BROWN
 
@@ -12,63 +14,78 @@ class VariableBox(VDict):
         super().__init__()
         self.name = name
         self.value = value
-        contents = str(value)
-        if isinstance(value, str):
-            contents = '"' + value + '"'
-        elif isinstance(value, List):
-            contents = '<list>'
-        nameT = Text(name, color=BLACK, font_size=18, font=ROBOTO_MONO)
+        contents = cell_text(value)
+        nameT = cached_text(name, ROBOTO_MONO, 18, color=BLACK)
         text_height = nameT.height
         margin_vert = (0.5 - text_height) / 2
+        # Kept so update_contents can size the box without the name again
+        self.name_width = nameT.width
 
         contentsT = code_value(contents)
-        box = Rectangle(height=0.5, width=nameT.width + contentsT.width + 0.5,
+        box = Rectangle(height=0.5, width=self.box_width(contentsT),
                         fill_color=WHITE, fill_opacity=1.0,
                         color=BLACK, stroke_width=1)
         dash = DashedLine([0, 0.45, 0], [0, 0.05, 0], color=BLACK, stroke_width=1)
         box.align_to([0, 0, 0], DL)
         nameT.align_to([0.1, text_height + margin_vert, 0], UL)
         dash.align_to(nameT.get_right() + [0.15, 0, 0], LEFT)
-        contentsT.next_to(nameT, RIGHT, buff=0.3)
-
-        # name is centered
-        hd_name, hd_contents = has_dipping_char(name), has_dipping_char(contents)
-        if hd_name == hd_contents:
-            contentsT.align_to(nameT, DOWN).shift(UP * 0.01)
-        elif hd_name and not hd_contents:
-            # It would be nice if this measured the text instead of hard-coded.
-            contentsT.align_to(nameT, DOWN).shift(UP * 0.05)
-        else:
-            contentsT.align_to(nameT, DOWN).shift(DOWN * 0.05)
+        place_contents(contentsT, nameT, name, contents)
 
         self.add([('box', box), ('name', nameT), ('contents', contentsT),
                   ('divider', dash)])
 
+    def box_width(self, contentsT: Mobject) -> float:
+        return self.name_width + contentsT.width + 0.5
+
     def all_but_contents(self):
         return [self['box'], self['name'], self['divider']]
 
+    @profiling.helper
     def update_contents(self, new_value, source):
         self.value = new_value
-
-        new_box = VariableBox(self.name, new_value)
+        contents = cell_text(new_value)
+
+        # The name and divider stay put, so only the new contents need
+        # to be made and the box stretched to fit them.
+        new_contents = code_value(contents)
+        place_contents(new_contents, self['name'], self.name, contents)
+        new_box = self['box'].copy()
+        new_box.stretch_to_fit_width(self.box_width(new_contents))
         new_box.align_to(self.get_corner(UL), UL)
 
         prev_contents = self['contents'].copy()
         self['contents'].become(source)
 
         return [
-            Transform(self['box'], new_box['box']),
-            Transform(self['contents'], new_box['contents']),
+            Transform(self['box'], new_box),
+            Transform(self['contents'], new_contents),
             FadeOut(prev_contents),
         ]
 
 
+def place_contents(contentsT: Mobject, nameT: Mobject, name: str, contents: str):
+    """Puts the contents of a VariableBox next to its name."""
+    contentsT.next_to(nameT, RIGHT, buff=0.3)
+
+    # name is centered
+    hd_name, hd_contents = has_dipping_char(name), has_dipping_char(contents)
+    if hd_name == hd_contents:
+        contentsT.align_to(nameT, DOWN).shift(UP * 0.01)
+    elif hd_name and not hd_contents:
+        # It would be nice if this measured the text instead of hard-coded.
+        contentsT.align_to(nameT, DOWN).shift(UP * 0.05)
+    else:
+        contentsT.align_to(nameT, DOWN).shift(DOWN * 0.05)
+    return contentsT
+
+
 def code_value(contents, replace_spaces=False):
     contents = str(contents)
     if replace_spaces:
-        return TextWithSpaces(contents, color=BLACK, font_size=18, font=LM_MONO)
+        return cached_text(contents, LM_MONO, 18, color=BLACK,
+                           text_class=TextWithSpaces)
     else:
-        return Text(contents, color=BLACK, font_size=18, font=LM_MONO)
+        return cached_text(contents, LM_MONO, 18, color=BLACK)
 
 
 def has_dipping_char(s):
@@ -196,6 +213,7 @@ class VariableArea(VDict):
     def top_scope(self) -> VariableScope:
         return self.scope_stack[-1]
 
+    @profiling.helper
     def push_variable_stack(self, initial_lines=0, vars_per_row=1):
         prev_scope = self.top_scope()
         new_scope = VariableScope(min_variables_width=prev_scope.width,
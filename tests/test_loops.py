@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip('manim')
+
+from manim_ace.loops import ForRange
+
+
+def make_range(start: int, stop: int, **kwargs) -> ForRange:
+    for_range = ForRange(loop_var=None, range_code=None, **kwargs)
+    for_range._make_range_and_targets(start, stop, 1)
+    return for_range
+
+
+def test_short_range_shows_every_item():
+    for_range = make_range(0, 5)
+    assert len(for_range.slots) == 5
+    assert [for_range._slot(i) for i in range(5)] == list(range(5))
+
+
+def test_long_range_shows_start_and_end():
+    for_range = make_range(0, 100, max_shown=12, shown_at_end=2)
+    # 9 items, the ellipsis, then 98 and 99
+    assert for_range.shown_at_start == 9
+    assert len(for_range.slots) == 12
+    assert [for_range._slot(i) for i in range(9)] == list(range(9))
+    assert for_range._slot(9) is None
+    assert for_range._slot(97) is None
+    assert for_range._slot(98) == 10
+    assert for_range._slot(99) == 11
+
+
+def test_nothing_shown_at_end():
+    for_range = make_range(0, 100, max_shown=12, shown_at_end=0)
+    assert for_range.shown_at_start == 11
+    assert len(for_range.slots) == 12
+    assert for_range._slot(10) == 10
+    assert for_range._slot(11) is None
+    assert for_range._slot(99) is None
+
+
+def test_left_out_item_without_items_at_end():
+    for_range = make_range(0, 100, max_shown=12, shown_at_end=0)
+    stand_in = for_range.target(99)
+    assert stand_in.height == pytest.approx(for_range.target(0).height)
+
+
+@pytest.mark.parametrize('max_shown, shown_at_end', [(12, -1), (3, 2), (1, 0)])
+def test_item_counts_are_checked(max_shown, shown_at_end):
+    with pytest.raises(AssertionError):
+        ForRange(loop_var=None, range_code=None, max_shown=max_shown,
+                 shown_at_end=shown_at_end)
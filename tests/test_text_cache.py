@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip('manim')
+
+from manim_ace.text_cache import TextCache
+
+
+class FakeText:
+    """Stands in for Text so these tests do not need Pango."""
+
+    built = 0
+
+    def __init__(self, s, **kwargs):
+        FakeText.built += 1
+        self.s = s
+        self.kwargs = kwargs
+
+    def copy(self):
+        return FakeText.__new__(FakeText)
+
+
+def get(cache: TextCache, s: str, **kwargs):
+    return cache.get(s, 'Monospace', 24, text_class=FakeText, **kwargs)
+
+
+def test_hits_and_misses():
+    cache = TextCache()
+    first = get(cache, 'a')
+    second = get(cache, 'a')
+    get(cache, 'a', color='#ff0000')
+    assert first is not second
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.stats()['hit_rate'] == pytest.approx(1 / 3)
+
+
+def test_least_recently_used_is_evicted():
+    cache = TextCache(max_entries=2)
+    get(cache, 'a')
+    get(cache, 'b')
+    get(cache, 'a')
+    get(cache, 'c')
+    assert len(cache) == 2
+    built = FakeText.built
+    get(cache, 'a')
+    assert FakeText.built == built
+    get(cache, 'b')
+    assert FakeText.built == built + 1
+
+
+def test_clear():
+    cache = TextCache()
+    get(cache, 'a')
+    get(cache, 'a')
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats() == {'entries': 0, 'max_entries': 1024, 'hits': 0,
+                             'misses': 0, 'hit_rate': 0.0}
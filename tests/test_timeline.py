@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip('manim')
+
+from manim_ace.timeline import EVENT, MERGED, MONTAGE, compile_trace
+from manim_ace.trace import ASSIGN, CALL, LINE, RETURN, ExecutionTrace
+
+
+def make_trace(*events) -> ExecutionTrace:
+    """events are (kind, line, depth, changes), all on whole lines."""
+    trace = ExecutionTrace('')
+    for kind, line, depth, changes in events:
+        trace.append(kind, line, 0, None, depth, changes)
+    return trace
+
+
+def loop_trace(iterations: int) -> ExecutionTrace:
+    # for i in range(iterations):
+    #     print(i)
+    events = []
+    for i in range(iterations):
+        events += [(LINE, 1, 0, ()), (ASSIGN, 1, 0, (('i', i),)),
+                   (LINE, 2, 0, ())]
+    return make_trace(*events)
+
+
+def test_moving_pc_to_same_line_is_dropped():
+    timeline = compile_trace(make_trace((LINE, 1, 0, ()), (LINE, 1, 0, ())))
+    assert [step.kind for step in timeline.steps] == [EVENT]
+    assert timeline.elided == 1
+    assert timeline.naive_plays == 2
+    assert timeline.compiled_plays == 1
+
+
+def test_updates_are_merged_with_next_line():
+    timeline = compile_trace(make_trace(
+        (LINE, 1, 0, ()),
+        (ASSIGN, 1, 0, (('x', 1),)),
+        (LINE, 2, 0, ()),
+        (ASSIGN, 2, 0, (('x', 2),)),
+        (LINE, 3, 0, ()),
+    ))
+    # Creating x cannot be merged, updating it can
+    assert [step.kind for step in timeline.steps] == [EVENT, EVENT, EVENT, MERGED]
+    assert timeline.merged == 1
+    assert timeline.naive_plays == 6
+    assert timeline.compiled_plays == 5
+
+
+def test_repeated_loop_becomes_montage():
+    timeline = compile_trace(loop_trace(10))
+    assert timeline.montages == 1
+    montage = timeline.steps[-1]
+    assert montage.kind == MONTAGE
+    # The first two iterations are shown as usual
+    assert montage.iterations == 8
+    assert len(montage.events) == 8 * 3
+    assert montage.final_values == (('i', 9),)
+    # 4 plays for the first iteration, 3 for each of the others
+    assert timeline.naive_plays == 4 + 9 * 3
+    # 4, then 2 with the update merged, then 1 for the montage
+    assert timeline.compiled_plays == 4 + 2 + 1
+
+
+def test_short_loop_is_not_a_montage():
+    timeline = compile_trace(loop_trace(3))
+    assert timeline.montages == 0
+    assert timeline.compiled_plays == 4 + 2 + 2
+
+
+def test_montages_can_be_turned_off():
+    timeline = compile_trace(loop_trace(10), montage_threshold=0)
+    assert timeline.montages == 0
+    assert MONTAGE not in [step.kind for step in timeline.steps]
+
+
+def test_pc_comes_back_after_return():
+    timeline = compile_trace(make_trace(
+        (LINE, 3, 0, ()),
+        (CALL, 1, 1, ()),
+        (LINE, 2, 1, ()),
+        (RETURN, 2, 1, (('return', None),)),
+        # Still on the line that made the call
+        (LINE, 3, 0, ()),
+    ))
+    assert timeline.elided == 1
+    assert len(timeline.steps) == 4
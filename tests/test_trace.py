@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip('manim')
+
+from manim_ace.trace import ASSIGN, CALL, LINE, RETURN, record
+
+
+def kinds(trace) -> list:
+    return [event.kind for event in trace]
+
+
+def assigned(trace) -> list:
+    return [name for event in trace if event.kind == ASSIGN
+            for name, _ in event.changes]
+
+
+def test_function_call():
+    trace = record('def double(x):\n'
+                   '    y = x * 2\n'
+                   '    return y\n'
+                   'd = double(3)\n')
+    assert trace.error is None
+    calls = [event for event in trace if event.kind == CALL]
+    assert len(calls) == 1
+    assert calls[0].line == 1
+    assert calls[0].changes == (('x', 3),)
+    returns = [event for event in trace if event.kind == RETURN]
+    assert returns[0].changes == (('return', 6),)
+    assert assigned(trace) == ['y', 'd']
+
+
+def test_comprehensions_and_lambdas_are_not_calls():
+    trace = record('squares = [k * k for k in range(3)]\n'
+                   'evens = {k for k in range(4) if k % 2 == 0}\n'
+                   'total = sum(k for k in range(3))\n'
+                   'inc = lambda v: v + 1\n'
+                   'z = inc(2)\n')
+    assert trace.error is None
+    assert CALL not in kinds(trace)
+    assert RETURN not in kinds(trace)
+    assert all(event.depth == 0 for event in trace)
+    assert assigned(trace) == ['squares', 'evens', 'total', 'z']
+
+
+def test_generator_is_one_call():
+    trace = record('def count(n):\n'
+                   '    i = 0\n'
+                   '    while i < n:\n'
+                   '        yield i\n'
+                   '        i += 1\n'
+                   'total = sum(count(3))\n')
+    assert trace.error is None
+    assert kinds(trace).count(CALL) == 1
+    assert kinds(trace).count(RETURN) == 1
+    # Only the first visit to the generator is traced
+    assert [event.line for event in trace if event.kind == LINE] == [1, 6, 2, 3, 4]
+    assert assigned(trace) == ['i', 'total']